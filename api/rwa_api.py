@@ -2,14 +2,21 @@
 RWA Yield Optimizer API - FastAPI服务端点
 """
 
-from fastapi import FastAPI, HTTPException, BackgroundTasks, Depends
+from fastapi import FastAPI, HTTPException, BackgroundTasks, Depends, Response
+from fastapi.encoders import jsonable_encoder
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel, Field
-from typing import List, Dict, Optional, Any
-from datetime import datetime
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import BaseModel, ConfigDict, Field
+from typing import List, Dict, Optional, Any, AsyncIterator, Awaitable, Callable, Literal, NoReturn
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
 import asyncio
 import logging
 import os
+import time
+
+import aiohttp
+import orjson
 
 from spoon_ai.agents import RWAYieldAgent, PortfolioOptimizerAgent
 from spoon_ai.chat import ChatBot
@@ -27,24 +34,74 @@ logger = logging.getLogger(__name__)
 app = FastAPI(
     title="RWA Yield Optimizer API",
     description="API for analyzing and optimizing RWA yields across DeFi protocols",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
-# 配置CORS
+# 配置CORS（ALLOWED_ORIGINS为逗号分隔的域名列表，未配置时允许任意来源但不携带凭证）
+_allowed_origins = [
+    origin.strip()
+    for origin in os.getenv("ALLOWED_ORIGINS", "*").split(",")
+    if origin.strip()
+]
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # 生产环境应该限制为特定域名
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_origins=_allowed_origins,
+    allow_credentials="*" not in _allowed_origins,
+    allow_methods=["GET", "POST"],
+    allow_headers=["content-type", "authorization"],
 )
 
 # 全局对象
 data_aggregator = RWADataAggregator()
 
+# 聚合收益数据的进程内TTL缓存（收益数据以分钟级变化，无需每个请求都访问上游）
+YIELDS_CACHE_TTL = float(os.getenv("YIELDS_CACHE_TTL", "30"))
+# 缓存年龄超过TTL的该比例后，在后台提前刷新，请求继续使用旧数据
+_YIELDS_REFRESH_RATIO = 0.8
+
+_yields_cache: Optional[Dict[str, Any]] = None
+_yields_cache_time: float = 0.0
+_yields_lock = asyncio.Lock()
+_yields_refresh_task: Optional[asyncio.Task] = None
+
+async def _refresh_all_yields() -> Dict[str, Any]:
+    """从上游重新获取全部协议数据并写入缓存"""
+    global _yields_cache, _yields_cache_time
+    async with _yields_lock:
+        # 等待锁期间可能已被其他协程刷新
+        if (_yields_cache is not None and
+                time.monotonic() - _yields_cache_time < YIELDS_CACHE_TTL * _YIELDS_REFRESH_RATIO):
+            return _yields_cache
+        data = await data_aggregator.fetch_all_yields()
+        _yields_cache = data
+        _yields_cache_time = time.monotonic()
+        return data
+
+async def _background_refresh_all_yields():
+    """后台刷新任务，失败时保留旧缓存"""
+    try:
+        await _refresh_all_yields()
+    except Exception as e:
+        logger.warning("Background yields refresh failed: %s", e)
+
+async def _cached_all_yields() -> Dict[str, Any]:
+    """获取全部协议数据（带TTL缓存）"""
+    global _yields_refresh_task
+    if _yields_cache is not None:
+        age = time.monotonic() - _yields_cache_time
+        if age < YIELDS_CACHE_TTL:
+            if (age >= YIELDS_CACHE_TTL * _YIELDS_REFRESH_RATIO and
+                    (_yields_refresh_task is None or _yields_refresh_task.done())):
+                _yields_refresh_task = asyncio.create_task(_background_refresh_all_yields())
+            return _yields_cache
+    return await _refresh_all_yields()
+
 # Pydantic模型定义
 class YieldAnalysisRequest(BaseModel):
     """收益分析请求"""
+    model_config = ConfigDict(extra="forbid")
+
     protocols: List[str] = Field(..., description="要分析的协议列表")
     asset_types: Optional[List[str]] = Field(None, description="资产类型过滤")
     timeframe: str = Field("30d", description="时间范围")
@@ -52,29 +109,46 @@ class YieldAnalysisRequest(BaseModel):
 
 class PortfolioOptimizationRequest(BaseModel):
     """投资组合优化请求"""
+    model_config = ConfigDict(extra="forbid")
+
     investment_amount: float = Field(..., gt=0, description="投资金额")
-    risk_tolerance: str = Field(..., regex="^(low|medium|high)$", description="风险承受度")
+    risk_tolerance: Literal["low", "medium", "high"] = Field(..., description="风险承受度")
     target_protocols: Optional[List[str]] = Field(None, description="目标协议")
     constraints: Optional[Dict[str, Any]] = Field(None, description="投资约束")
-    optimization_goal: str = Field("balanced", regex="^(max_yield|min_risk|balanced)$")
+    optimization_goal: Literal["max_yield", "min_risk", "balanced"] = Field("balanced")
 
 class CompareYieldsRequest(BaseModel):
     """收益率比较请求"""
-    protocols: List[str] = Field(..., min_items=2, description="要比较的协议")
+    model_config = ConfigDict(extra="forbid")
+
+    protocols: List[str] = Field(..., min_length=2, description="要比较的协议")
     asset_type: Optional[str] = Field(None, description="资产类型")
     metrics: List[str] = Field(["apy", "risk", "liquidity"], description="比较指标")
 
 class YieldForecastRequest(BaseModel):
     """收益预测请求"""
+    model_config = ConfigDict(extra="forbid")
+
     protocol: str = Field(..., description="协议名称")
     asset_type: str = Field(..., description="资产类型")
     forecast_period: str = Field("90d", description="预测期限")
     include_scenarios: bool = Field(True, description="是否包含情景分析")
 
-# 依赖注入
-async def get_yield_agent() -> RWAYieldAgent:
-    """获取收益分析Agent实例"""
-    agent = RWAYieldAgent(
+# Agent池：进程级复用Agent实例，避免每个请求重复构建Agent/ChatBot/工具
+# Agent在运行期间持有状态，因此每次借出独占一个实例；池空时按需创建新实例，
+# 归还时若池已满则直接丢弃，从而保证并发请求之间不会互相等待。
+# 池按需填充，启动时不构建Agent，缺少LLM密钥等配置问题只影响对应请求
+AGENT_POOL_SIZE = int(os.getenv("AGENT_POOL_SIZE", "4"))
+
+_yield_agent_pool: asyncio.Queue = asyncio.Queue(maxsize=AGENT_POOL_SIZE)
+_portfolio_agent_pool: asyncio.Queue = asyncio.Queue(maxsize=AGENT_POOL_SIZE)
+
+# 请求期间可能被改写、而ToolCallAgent.clear()不会恢复的字段（如卡住时追加的提示词）
+_YIELD_AGENT_REQUEST_FIELDS = ("next_step_prompt", "output_queue", "task_done")
+
+async def _create_yield_agent() -> RWAYieldAgent:
+    """创建收益分析Agent实例"""
+    return RWAYieldAgent(
         llm=ChatBot(llm_provider="openai"),
         available_tools=ToolManager([
             RWAProtocolDataTool(),
@@ -82,126 +156,270 @@ async def get_yield_agent() -> RWAYieldAgent:
             RWAPortfolioAnalysisTool()
         ])
     )
-    return agent
 
-async def get_portfolio_agent() -> PortfolioOptimizerAgent:
-    """获取投资组合优化Agent实例"""
+async def _create_portfolio_agent() -> PortfolioOptimizerAgent:
+    """创建并初始化投资组合优化Agent实例"""
     agent = PortfolioOptimizerAgent(llm=ChatBot(llm_provider="openai"))
     await agent.initialize()
     return agent
 
+def _reset_yield_agent(agent: RWAYieldAgent):
+    """归还前重置收益分析Agent：清空记忆和状态，并将请求期间改写的字段恢复为默认值"""
+    agent.clear()
+    fields = type(agent).model_fields
+    for name in _YIELD_AGENT_REQUEST_FIELDS:
+        setattr(agent, name, fields[name].get_default(call_default_factory=True))
+
+@asynccontextmanager
+async def _borrow_agent(
+    pool: asyncio.Queue,
+    factory: Callable[[], Awaitable[Any]],
+    reset: Callable[[Any], None]
+):
+    """从池中借出一个Agent实例，使用完毕后重置并归还"""
+    try:
+        agent = pool.get_nowait()
+    except asyncio.QueueEmpty:
+        agent = await factory()
+    try:
+        yield agent
+    finally:
+        reset(agent)
+        try:
+            pool.put_nowait(agent)
+        except asyncio.QueueFull:
+            pass
+
+async def _borrow_yield_agent():
+    """借出收益分析Agent的上下文管理器"""
+    return _borrow_agent(_yield_agent_pool, _create_yield_agent, _reset_yield_agent)
+
+# 依赖注入
+async def get_yield_agent() -> AsyncIterator[RWAYieldAgent]:
+    """获取收益分析Agent实例"""
+    async with await _borrow_yield_agent() as agent:
+        yield agent
+
+async def get_portfolio_agent() -> AsyncIterator[PortfolioOptimizerAgent]:
+    """获取投资组合优化Agent实例"""
+    async with _borrow_agent(
+        _portfolio_agent_pool, _create_portfolio_agent, PortfolioOptimizerAgent.clear_state
+    ) as agent:
+        yield agent
+
+# 进程内同时进行的LLM预测调用上限，避免突发请求对上游造成过大压力
+FORECAST_CONCURRENCY = int(os.getenv("FORECAST_CONCURRENCY", "3"))
+_forecast_semaphore = asyncio.Semaphore(FORECAST_CONCURRENCY)
+
+async def _forecast_with_pooled_agent(protocol: str, asset_type: str, forecast_period: str) -> Dict[str, Any]:
+    """使用独立的Agent实例执行单个预测，以便与其他Agent调用并发运行"""
+    async with _forecast_semaphore, await _borrow_yield_agent() as agent:
+        return await agent.forecast_yields(
+            protocol=protocol,
+            asset_type=asset_type,
+            forecast_period=forecast_period
+        )
+
+# 上游数据源或LLM不可用时返回的固定错误信息，不暴露内部异常细节
+_UPSTREAM_ERROR_DETAIL = "upstream_unavailable"
+_UPSTREAM_ERRORS = (aiohttp.ClientError, asyncio.TimeoutError, ConnectionError)
+
+async def _forecast_entry(protocol: str, asset_type: str, forecast_period: str) -> Dict[str, Any]:
+    """执行单个预测并返回带协议名的结果项，失败时返回显式的错误项而不是抛出"""
+    try:
+        forecast = await _forecast_with_pooled_agent(protocol, asset_type, forecast_period)
+        return {"protocol": protocol, "forecast": jsonable_encoder(forecast)}
+    except Exception as e:
+        if isinstance(e, _UPSTREAM_ERRORS):
+            logger.error("Error forecasting yields for %s: %s", protocol, e)
+            return {"protocol": protocol, "error": _UPSTREAM_ERROR_DETAIL}
+        logger.error("Error forecasting yields for %s: %s", protocol, e, exc_info=True)
+        return {"protocol": protocol, "error": str(e)}
+
+def _raise_http_error(message: str, e: Exception) -> NoReturn:
+    """记录异常并转换为HTTPException"""
+    if isinstance(e, _UPSTREAM_ERRORS):
+        logger.error("%s: %s", message, e)
+        raise HTTPException(status_code=500, detail=_UPSTREAM_ERROR_DETAIL) from e
+    logger.error("%s: %s", message, e, exc_info=True)
+    raise HTTPException(status_code=500, detail=str(e)) from e
+
+# 响应时间戳按秒缓存，同一秒内的请求复用同一个ISO字符串
+_timestamp_second: int = -1
+_timestamp_iso: str = ""
+
+def _utc_timestamp() -> str:
+    """获取当前UTC时间的ISO格式字符串（秒级精度）"""
+    global _timestamp_second, _timestamp_iso
+    second = int(time.time())
+    if second != _timestamp_second:
+        # 保持原有无时区后缀的输出格式
+        _timestamp_iso = datetime.fromtimestamp(second, timezone.utc).replace(tzinfo=None).isoformat()
+        _timestamp_second = second
+    return _timestamp_iso
+
+# 静态响应（导入时预序列化，避免每次请求重复构建和编码）
+_ROOT_JSON = orjson.dumps({
+    "message": "RWA Yield Optimizer API",
+    "version": "1.0.0",
+    "endpoints": {
+        "yields": "/api/v1/yields",
+        "portfolio": "/api/v1/portfolio",
+        "protocols": "/api/v1/protocols",
+        "health": "/health"
+    }
+})
+
+_PROTOCOL_LIST = (
+    {
+        "id": "centrifuge",
+        "name": "Centrifuge",
+        "description": "Real-world asset tokenization platform",
+        "asset_types": ["real_estate", "invoices", "carbon_credits"]
+    },
+    {
+        "id": "goldfinch",
+        "name": "Goldfinch",
+        "description": "Decentralized credit protocol",
+        "asset_types": ["private_credit"]
+    },
+    {
+        "id": "maple",
+        "name": "Maple Finance",
+        "description": "Institutional capital marketplace",
+        "asset_types": ["private_credit", "bonds"]
+    },
+    {
+        "id": "credix",
+        "name": "Credix",
+        "description": "Credit ecosystem for emerging markets",
+        "asset_types": ["private_credit", "invoices"]
+    }
+)
+
+_PROTOCOLS_JSON = orjson.dumps({"protocols": _PROTOCOL_LIST})
+
+# 情景分析（静态内容，所有预测响应共享，请勿修改）
+_SCENARIOS = {
+    "bull_market": {
+        "description": "牛市情景 - 整体市场上涨",
+        "impact": "+20% to +50% APY",
+        "probability": 0.25
+    },
+    "bear_market": {
+        "description": "熊市情景 - 市场下跌",
+        "impact": "-30% to -10% APY",
+        "probability": 0.25
+    },
+    "stable_market": {
+        "description": "稳定市场 - 小幅波动",
+        "impact": "-5% to +5% APY",
+        "probability": 0.5
+    }
+}
+
+# 请求的协议数不超过该值时，只获取这些协议的数据，而不是全量数据
+_SUBSET_FETCH_LIMIT = 3
+
+async def _fetch_requested_yields(protocols: List[str]) -> Dict[str, Any]:
+    """获取请求所需的协议数据，优先复用全量缓存"""
+    if len(protocols) > _SUBSET_FETCH_LIMIT:
+        return await _cached_all_yields()
+    if _yields_cache is not None and time.monotonic() - _yields_cache_time < YIELDS_CACHE_TTL:
+        return _yields_cache
+    return await data_aggregator.fetch_yields(protocols)
+
 # API端点
 @app.get("/")
 async def root():
     """API根路径"""
-    return {
-        "message": "RWA Yield Optimizer API",
-        "version": "1.0.0",
-        "endpoints": {
-            "yields": "/api/v1/yields",
-            "portfolio": "/api/v1/portfolio",
-            "protocols": "/api/v1/protocols",
-            "health": "/health"
-        }
-    }
+    return Response(content=_ROOT_JSON, media_type="application/json")
 
 @app.get("/health")
 async def health_check():
     """健康检查"""
     return {
         "status": "healthy",
-        "timestamp": datetime.utcnow().isoformat()
+        "timestamp": _utc_timestamp()
     }
 
 @app.get("/api/v1/protocols")
 async def list_protocols():
     """获取支持的协议列表"""
-    return {
-        "protocols": [
-            {
-                "id": "centrifuge",
-                "name": "Centrifuge",
-                "description": "Real-world asset tokenization platform",
-                "asset_types": ["real_estate", "invoices", "carbon_credits"]
-            },
-            {
-                "id": "goldfinch",
-                "name": "Goldfinch",
-                "description": "Decentralized credit protocol",
-                "asset_types": ["private_credit"]
-            },
-            {
-                "id": "maple",
-                "name": "Maple Finance",
-                "description": "Institutional capital marketplace",
-                "asset_types": ["private_credit", "bonds"]
-            },
-            {
-                "id": "credix",
-                "name": "Credix",
-                "description": "Credit ecosystem for emerging markets",
-                "asset_types": ["private_credit", "invoices"]
-            }
-        ]
-    }
+    return Response(content=_PROTOCOLS_JSON, media_type="application/json")
 
 @app.post("/api/v1/yields/analyze")
 async def analyze_yields(
     request: YieldAnalysisRequest,
     agent: RWAYieldAgent = Depends(get_yield_agent)
 ):
-    """分析RWA收益率"""
+    """分析RWA收益率
+
+    响应以流式JSON返回：数据与分析部分就绪后立即发送，预测结果按完成顺序
+    逐个写出，客户端无需等待最慢的预测即可开始接收。每个预测项形如
+    {"protocol": ..., "forecast": ...}，失败时为 {"protocol": ..., "error": ...}。
+    """
+    forecast_tasks: List[asyncio.Task] = []
     try:
-        # 获取聚合数据
-        protocol_data = await data_aggregator.fetch_all_yields()
+        asset_type = request.asset_types[0] if request.asset_types else None
         
-        # 过滤请求的协议
-        filtered_data = {
-            p: data for p, data in protocol_data.items() 
-            if p in request.protocols
-        }
+        # 预测使用独立的Agent实例，与数据获取和分析并发执行（限制预测数量）
+        if request.include_forecast:
+            forecast_tasks = [
+                asyncio.create_task(
+                    _forecast_entry(protocol, asset_type or "mixed", request.timeframe)
+                )
+                for protocol in request.protocols[:3]
+            ]
         
-        # 使用Agent进行深度分析
-        analysis_result = await agent.compare_yields(
-            protocols=request.protocols,
-            asset_type=request.asset_types[0] if request.asset_types else None
+        protocol_data, analysis_result = await asyncio.gather(
+            _fetch_requested_yields(request.protocols),
+            agent.compare_yields(protocols=request.protocols, asset_type=asset_type)
         )
         
-        # 组合响应
-        response = {
-            "timestamp": datetime.utcnow().isoformat(),
-            "protocols_analyzed": len(filtered_data),
-            "timeframe": request.timeframe,
-            "data": {
-                protocol: {
-                    "current_apy": data.apy,
-                    "tvl": data.tvl,
-                    "risk_score": data.risk_score,
-                    "pools": data.pools
-                } for protocol, data in filtered_data.items()
-            },
-            "analysis": analysis_result
+        # 过滤请求的协议并一次性构建数据部分
+        wanted = frozenset(request.protocols)
+        data_section = {
+            protocol: {
+                "current_apy": data.apy,
+                "tvl": data.tvl,
+                "risk_score": data.risk_score,
+                "pools": data.pools
+            } for protocol, data in protocol_data.items()
+            if protocol in wanted
         }
         
-        # 添加预测（如果请求）
-        if request.include_forecast:
-            forecast_tasks = []
-            for protocol in request.protocols[:3]:  # 限制预测数量
-                forecast_tasks.append(
-                    agent.forecast_yields(
-                        protocol=protocol,
-                        asset_type=request.asset_types[0] if request.asset_types else "mixed",
-                        forecast_period=request.timeframe
-                    )
-                )
-            forecasts = await asyncio.gather(*forecast_tasks)
-            response["forecasts"] = forecasts
-        
-        return response
+        # 响应头部（去掉结尾的"}"，以便继续追加预测部分）；先转换为JSON兼容类型，
+        # 编码错误在开始发送前出现，仍可返回500
+        head = orjson.dumps(jsonable_encoder({
+            "timestamp": _utc_timestamp(),
+            "protocols_analyzed": len(data_section),
+            "timeframe": request.timeframe,
+            "data": data_section,
+            "analysis": analysis_result
+        }))[:-1]
         
     except Exception as e:
-        logger.error(f"Error analyzing yields: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+        for task in forecast_tasks:
+            task.cancel()
+        _raise_http_error("Error analyzing yields", e)
+    
+    async def stream():
+        try:
+            yield head
+            if request.include_forecast:
+                yield b',"forecasts":['
+                # 按完成顺序写出；响应已开始发送，失败的预测以错误项表示
+                for i, next_entry in enumerate(asyncio.as_completed(forecast_tasks)):
+                    yield (b"," if i else b"") + orjson.dumps(await next_entry)
+                yield b"]"
+            yield b"}"
+        finally:
+            # 客户端提前断开时取消尚未完成的预测
+            for task in forecast_tasks:
+                task.cancel()
+    
+    return StreamingResponse(stream(), media_type="application/json")
 
 @app.post("/api/v1/portfolio/optimize")
 async def optimize_portfolio(
@@ -231,7 +449,7 @@ async def optimize_portfolio(
         optimized_portfolio = result.get("optimized_portfolio", {})
         
         response = {
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": _utc_timestamp(),
             "investment_amount": request.investment_amount,
             "risk_tolerance": request.risk_tolerance,
             "portfolio": optimized_portfolio,
@@ -245,14 +463,14 @@ async def optimize_portfolio(
             "rebalancing_schedule": result.get("rebalancing_schedule", [])
         }
         
-        # 添加后台任务记录优化历史
-        background_tasks.add_task(log_optimization, request.dict(), response)
+        # 添加后台任务记录优化历史（日志关闭时跳过）
+        if logger.isEnabledFor(logging.INFO):
+            background_tasks.add_task(log_optimization, request.investment_amount)
         
         return response
         
     except Exception as e:
-        logger.error(f"Error optimizing portfolio: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+        _raise_http_error("Error optimizing portfolio", e)
 
 @app.post("/api/v1/yields/compare")
 async def compare_yields(
@@ -261,42 +479,56 @@ async def compare_yields(
 ):
     """比较不同协议的收益率"""
     try:
-        comparison = await agent.compare_yields(
-            protocols=request.protocols,
-            asset_type=request.asset_type
+        # Agent分析与详细数据获取并发执行
+        comparison, protocol_data = await asyncio.gather(
+            agent.compare_yields(
+                protocols=request.protocols,
+                asset_type=request.asset_type
+            ),
+            _fetch_requested_yields(request.protocols)
         )
         
-        # 获取详细数据
-        protocol_data = await data_aggregator.fetch_all_yields()
+        metrics_set = frozenset(request.metrics)
+        want_apy = "apy" in metrics_set
+        want_risk = "risk" in metrics_set
+        want_liquidity = "liquidity" in metrics_set
         
-        # 构建比较矩阵
+        # 构建比较矩阵，同时一次遍历求出各指标的最优协议
         comparison_matrix = {}
+        highest_apy = lowest_risk = highest_liquidity = None
+        best_apy = best_tvl = float("-inf")
+        best_risk = float("inf")
         for protocol in request.protocols:
-            if protocol in protocol_data:
-                data = protocol_data[protocol]
+            data = protocol_data.get(protocol)
+            if data is not None:
                 comparison_matrix[protocol] = {
-                    "apy": data.apy if "apy" in request.metrics else None,
-                    "risk_score": data.risk_score if "risk" in request.metrics else None,
-                    "tvl": data.tvl if "liquidity" in request.metrics else None,
+                    "apy": data.apy if want_apy else None,
+                    "risk_score": data.risk_score if want_risk else None,
+                    "tvl": data.tvl if want_liquidity else None,
                     "pools_count": len(data.pools)
                 }
+                if want_apy and data.apy > best_apy:
+                    best_apy, highest_apy = data.apy, protocol
+                if want_risk and data.risk_score < best_risk:
+                    best_risk, lowest_risk = data.risk_score, protocol
+                if want_liquidity and data.tvl > best_tvl:
+                    best_tvl, highest_liquidity = data.tvl, protocol
         
         return {
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": _utc_timestamp(),
             "protocols": request.protocols,
             "asset_type": request.asset_type,
             "comparison_matrix": comparison_matrix,
             "analysis": comparison,
             "best_by_metric": {
-                "highest_apy": max(comparison_matrix.items(), key=lambda x: x[1].get("apy", 0))[0] if "apy" in request.metrics else None,
-                "lowest_risk": min(comparison_matrix.items(), key=lambda x: x[1].get("risk_score", 1))[0] if "risk" in request.metrics else None,
-                "highest_liquidity": max(comparison_matrix.items(), key=lambda x: x[1].get("tvl", 0))[0] if "liquidity" in request.metrics else None
+                "highest_apy": highest_apy,
+                "lowest_risk": lowest_risk,
+                "highest_liquidity": highest_liquidity
             }
         }
         
     except Exception as e:
-        logger.error(f"Error comparing yields: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+        _raise_http_error("Error comparing yields", e)
 
 @app.post("/api/v1/yields/forecast")
 async def forecast_yields(
@@ -312,7 +544,7 @@ async def forecast_yields(
         )
         
         response = {
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": _utc_timestamp(),
             "protocol": request.protocol,
             "asset_type": request.asset_type,
             "forecast_period": request.forecast_period,
@@ -321,30 +553,12 @@ async def forecast_yields(
         
         # 添加情景分析
         if request.include_scenarios:
-            scenarios = {
-                "bull_market": {
-                    "description": "牛市情景 - 整体市场上涨",
-                    "impact": "+20% to +50% APY",
-                    "probability": 0.25
-                },
-                "bear_market": {
-                    "description": "熊市情景 - 市场下跌",
-                    "impact": "-30% to -10% APY",
-                    "probability": 0.25
-                },
-                "stable_market": {
-                    "description": "稳定市场 - 小幅波动",
-                    "impact": "-5% to +5% APY",
-                    "probability": 0.5
-                }
-            }
-            response["scenarios"] = scenarios
+            response["scenarios"] = _SCENARIOS
         
         return response
         
     except Exception as e:
-        logger.error(f"Error forecasting yields: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+        _raise_http_error("Error forecasting yields", e)
 
 @app.get("/api/v1/yields/top-pools")
 async def get_top_pools(
@@ -356,26 +570,24 @@ async def get_top_pools(
         top_pools = await data_aggregator.get_top_pools(criteria=criteria, limit=limit)
         
         return {
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": _utc_timestamp(),
             "criteria": criteria,
             "limit": limit,
             "pools": top_pools
         }
         
     except Exception as e:
-        logger.error(f"Error getting top pools: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+        _raise_http_error("Error getting top pools", e)
 
 @app.get("/api/v1/stats/aggregate")
 async def get_aggregate_stats():
     """获取聚合统计数据"""
     try:
-        stats = await data_aggregator.get_aggregated_stats()
+        stats = await data_aggregator.get_aggregated_stats(await _cached_all_yields())
         return stats
         
     except Exception as e:
-        logger.error(f"Error getting aggregate stats: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+        _raise_http_error("Error getting aggregate stats", e)
 
 @app.get("/api/v1/alerts/yield-changes")
 async def get_yield_change_alerts(threshold: float = 0.5):
@@ -384,21 +596,20 @@ async def get_yield_change_alerts(threshold: float = 0.5):
         alerts = await data_aggregator.monitor_yield_changes(threshold=threshold)
         
         return {
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": _utc_timestamp(),
             "threshold": threshold,
             "alerts": alerts,
             "alert_count": len(alerts)
         }
         
     except Exception as e:
-        logger.error(f"Error getting yield alerts: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+        _raise_http_error("Error getting yield alerts", e)
 
 # 辅助函数
-async def log_optimization(request_data: Dict, response_data: Dict):
+async def log_optimization(investment_amount: float):
     """记录优化历史（后台任务）"""
     # 这里可以保存到数据库或日志文件
-    logger.info(f"Portfolio optimization completed: {request_data['investment_amount']} USD")
+    logger.info("Portfolio optimization completed: %s USD", investment_amount)
 
 # 启动事件
 @app.on_event("startup")
@@ -407,10 +618,10 @@ async def startup_event():
     logger.info("RWA Yield Optimizer API starting up...")
     # 预热缓存
     try:
-        await data_aggregator.fetch_all_yields()
+        await _cached_all_yields()
         logger.info("Data cache warmed up successfully")
     except Exception as e:
-        logger.error(f"Failed to warm up cache: {e}")
+        logger.error("Failed to warm up cache: %s", e)
 
 # 关闭事件
 @app.on_event("shutdown")
@@ -425,11 +636,23 @@ if __name__ == "__main__":
     host = os.getenv("SERVER_HOST", "0.0.0.0")
     port = int(os.getenv("SERVER_PORT", "8000"))
     
-    # 运行服务器
-    uvicorn.run(
-        "api.rwa_api:app",
-        host=host,
-        port=port,
-        reload=True,
-        log_level="info"
-    )
\ No newline at end of file
+    # 开发模式下启用热重载（单进程）；生产模式使用多worker，
+    # loop/http为auto时在已安装的情况下自动选用uvloop与httptools
+    if os.getenv("ENV") == "dev":
+        uvicorn.run(
+            "api.rwa_api:app",
+            host=host,
+            port=port,
+            reload=True,
+            log_level="info"
+        )
+    else:
+        uvicorn.run(
+            "api.rwa_api:app",
+            host=host,
+            port=port,
+            workers=int(os.getenv("WORKERS", str(os.cpu_count() or 1))),
+            loop="auto",
+            http="auto",
+            log_level="warning"
+        )
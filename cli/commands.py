@@ -1,40 +1,48 @@
+import argparse
 import asyncio
 import datetime
+import functools
+import importlib.util
 import json
 import logging
 import os
+import platform
+import re
 import shlex
 import sys
+import time
 import traceback
+from collections import deque
 from pathlib import Path
-from typing import Callable, Dict, List, Any
+from typing import Callable, Dict, List, Any, Optional
 
-from prompt_toolkit import PromptSession, print_formatted_text
-from prompt_toolkit.completion import WordCompleter
-from prompt_toolkit.formatted_text import HTML as PromptHTML
-from prompt_toolkit.history import FileHistory
+import orjson
+from prompt_toolkit import print_formatted_text
+from prompt_toolkit.formatted_text import FormattedText, HTML as PromptHTML, merge_formatted_text, to_formatted_text
 from prompt_toolkit.styles import Style
 
-from spoon_ai.agents import SpoonReactAI, SpoonReactMCP
-from spoon_ai.retrieval.document_loader import DocumentLoader
-from spoon_ai.schema import Message, Role
-from spoon_ai.trade.aggregator import Aggregator
+from spoon_ai.schema import AgentState, Message, Role
 from spoon_ai.config.manager import ConfigManager
 
+# Heavier dependencies (agents, document loading, trading, Telegram and the
+# interactive prompt session) are imported inside the handlers that need them
+
 
 # Create a log filter to filter out log messages containing specific keywords
 class KeywordFilter(logging.Filter):
     def __init__(self, keywords):
         super().__init__()
         self.keywords = keywords
+        # A single case-insensitive alternation scans each message once
+        self._pattern = re.compile("|".join(re.escape(keyword) for keyword in keywords), re.IGNORECASE)
 
     def filter(self, record):
+        # Errors are never treated as startup noise; skip formatting and scanning them
+        if record.levelno >= logging.ERROR:
+            return True
         # If the log message contains any keywords, don't display this message
-        if record.getMessage():
-            for keyword in self.keywords:
-                if keyword.lower() in record.getMessage().lower():
-                    return False
-        return True
+        message = record.getMessage()
+        return not (message and self._pattern.search(message))
 
 # Set up basic logging configuration
 logging.basicConfig(level=logging.INFO, format='%(message)s')
@@ -62,38 +70,194 @@ keyword_filter = KeywordFilter([
 ])
 logger.addFilter(keyword_filter)
 
-# Also apply filter to root logger
-root_logger = logging.getLogger()
-root_logger.addFilter(keyword_filter)
-
-# Disable logs from third-party libraries by setting them to ERROR level or higher
-logging.getLogger("openai").setLevel(logging.ERROR)
-logging.getLogger("requests").setLevel(logging.ERROR)
-logging.getLogger("urllib3").setLevel(logging.ERROR)
-logging.getLogger("httpx").setLevel(logging.ERROR)
-logging.getLogger("chromadb").setLevel(logging.ERROR)
-logging.getLogger("chroma").setLevel(logging.ERROR)
-logging.getLogger("langchain").setLevel(logging.ERROR)
-logging.getLogger("anthropic").setLevel(logging.ERROR)
-logging.getLogger("google").setLevel(logging.ERROR)
-logging.getLogger("fastmcp").setLevel(logging.ERROR)
-
-# Disable verbose logs from internal modules during startup
-logging.getLogger("spoon_ai.config").setLevel(logging.WARNING)
-logging.getLogger("spoon_ai.llm").setLevel(logging.WARNING)
-logging.getLogger("spoon_ai.utils.config_manager").setLevel(logging.WARNING)
-from spoon_ai.schema import AgentState
-from spoon_ai.social_media.telegram import TelegramClient
+# Logger levels applied when the CLI starts: third-party libraries only report
+# errors, verbose internal modules only report warnings
+QUIET_LOGGERS = (
+    ("openai", logging.ERROR),
+    ("requests", logging.ERROR),
+    ("urllib3", logging.ERROR),
+    ("httpx", logging.ERROR),
+    ("chromadb", logging.ERROR),
+    ("chroma", logging.ERROR),
+    ("langchain", logging.ERROR),
+    ("anthropic", logging.ERROR),
+    ("google", logging.ERROR),
+    ("fastmcp", logging.ERROR),
+    ("spoon_ai.config", logging.WARNING),
+    ("spoon_ai.llm", logging.WARNING),
+    ("spoon_ai.utils.config_manager", logging.WARNING),
+)
+
+def silence_third_party_loggers():
+    for name, level in QUIET_LOGGERS:
+        logging.getLogger(name).setLevel(level)
 
 # handler = logging.StreamHandler()
 # handler.setFormatter(ColoredFormatter())
 # logger.addHandler(handler)
 
-DEBUG = False
+# Streamed tokens are written without flushing each one; stdout is flushed at
+# most every STREAM_FLUSH_INTERVAL seconds or when a chunk ends a line/sentence
+STREAM_FLUSH_INTERVAL = 0.03
+STREAM_FLUSH_ENDINGS = ("\n", ".", "!", "?", "。", "！", "？")
+
+# ANSI equivalents of the chat style classes used on the per-turn output path;
+# empty when stdout is not a terminal, matching prompt_toolkit's behaviour
+if sys.stdout.isatty():
+    ANSI_AGENT = "\x1b[1;36m"  # ansicyan bold
+    ANSI_THINKING = "\x1b[33m"  # ansiyellow
+    ANSI_RESET = "\x1b[0m"
+else:
+    ANSI_AGENT = ANSI_THINKING = ANSI_RESET = ""
+
+@functools.lru_cache(maxsize=None)
+def get_spoon_react_cls():
+    """Return the SpoonReactAI class, importing the agents package on first use"""
+    from spoon_ai.agents.spoon_react import SpoonReactAI
+    return SpoonReactAI
+
+@functools.lru_cache(maxsize=None)
+def get_toolkit_config_cls():
+    """Return ToolkitConfig, importing the toolkit integration module on first use"""
+    from spoon_ai.tools.toolkit_integration import ToolkitConfig
+    return ToolkitConfig
+
+@functools.lru_cache(maxsize=None)
+def get_react_agent_cls():
+    """Return the ReActAgent base class, importing the agents package on first use"""
+    from spoon_ai.agents.react import ReActAgent
+    return ReActAgent
+
+# Input prompt for chat and react sessions, parsed once instead of on every turn
+USER_PROMPT = PromptHTML("<user>You</user> > ")
+
+# Directory for chat session logs, created on the first chat session
+CHAT_LOG_DIR = Path('chat_logs')
+
+# Recent messages replayed when a chat session starts unless the config sets
+# history_window; the saved history and the chat log keep every message
+DEFAULT_HISTORY_WINDOW = 200
+
+# Set SPOON_CLI_DEBUG=1 to log chat streaming internals; call sites check the
+# flag first so their f-strings aren't built when it is off
+CLI_DEBUG = os.environ.get('SPOON_CLI_DEBUG') == '1'
 def cli_debug_log(message):
-    if DEBUG:
+    if CLI_DEBUG:
         logger.info(f"CLI DEBUG: {message}\n")
 
+def print_formatted_lines(lines):
+    """Print a list of formatted-text lines with a single print_formatted_text call"""
+    parts = []
+    for line in lines:
+        parts.append(line)
+        parts.append("\n")
+    print_formatted_text(merge_formatted_text(parts), end="")
+
+# Environment variables reported by system-info, with their display names
+SYSTEM_INFO_ENV_VARS = (
+    ("OPENAI_API_KEY", "OpenAI API"),
+    ("ANTHROPIC_API_KEY", "Anthropic API"),
+    ("DEEPSEEK_API_KEY", "DeepSeek API"),
+    ("TAVILY_API_KEY", "Tavily Search API"),
+    ("SECRET_KEY", "JWT Secret Key"),
+    ("TELEGRAM_BOT_TOKEN", "Telegram Bot"),
+    ("GITHUB_TOKEN", "GitHub API"),
+    ("PRIVATE_KEY", "Wallet Private Key"),
+    ("RPC_URL", "Blockchain RPC"),
+    ("DATABASE_URL", "Database"),
+    ("REDIS_HOST", "Redis Host"),
+)
+
+# Any one of these counts as a configured LLM provider in the system-info health check
+LLM_API_KEY_VARS = frozenset({"OPENAI_API_KEY", "ANTHROPIC_API_KEY", "DEEPSEEK_API_KEY"})
+
+# Whether the spoon_ai package can be found, for the system-info health check;
+# find_spec locates it without running the package __init__
+SPOON_AI_AVAILABLE = importlib.util.find_spec("spoon_ai") is not None
+
+# Environment variables captured by SpoonAICLI._get_env_snapshot
+TRACKED_ENV_VARS = frozenset(name for name, _ in SYSTEM_INFO_ENV_VARS) | LLM_API_KEY_VARS
+
+# Command groups shown in the system-info summary
+COMMAND_CATEGORIES = {
+    "Core": ["help", "exit", "system-info"],
+    "Agent": ["load-agent", "list-agents", "action", "reload-config"],
+    "Chat": ["new-chat", "list-chats", "load-chat"],
+    "Config": ["config"],
+    "Crypto": ["transfer", "swap", "token-info", "token-by-symbol"],
+    "Tools": ["load-docs", "list-toolkit-categories", "list-toolkit-tools", "load-toolkit-tools"],
+    "Social": ["telegram"],
+}
+
+def _stdout_can_encode(text: str) -> bool:
+    encoding = getattr(sys.stdout, "encoding", None) or "ascii"
+    try:
+        text.encode(encoding)
+    except (UnicodeEncodeError, LookupError):
+        return False
+    return True
+
+# Rule printed under command headers; plain "=" when stdout can't encode box drawing
+SEPARATOR = "═" * 39 if _stdout_can_encode("═") else "=" * 39
+SEPARATOR_LINE = f"<ansiwhite>{SEPARATOR}</ansiwhite>"
+
+# Headers of the system-info and config commands, parsed once at import
+BANNER_LINE = PromptHTML(SEPARATOR_LINE)
+SYSTEM_INFO_HEADER = PromptHTML(
+    "<ansiblue><b>🔍 SpoonAI System Information</b></ansiblue>\n"
+    f"{SEPARATOR_LINE}\n"
+    "<ansiyellow><b>📊 System Details:</b></ansiyellow>"
+)
+MIGRATE_HEADER = PromptHTML(f"<ansiblue><b>🔄 Configuration Migration</b></ansiblue>\n{SEPARATOR_LINE}")
+CHECK_HEADER = PromptHTML(f"<ansiblue><b>🔍 Configuration Check</b></ansiblue>\n{SEPARATOR_LINE}")
+VALIDATE_HEADER = PromptHTML(f"<ansiblue><b>✅ Configuration Validation</b></ansiblue>\n{SEPARATOR_LINE}")
+
+# Full migrate-config help text, printed with a single call
+MIGRATE_HELP = to_formatted_text(merge_formatted_text([
+    PromptHTML(f"<ansiblue><b>🔄 Configuration Migration Help</b></ansiblue>\n{SEPARATOR_LINE}\n"),
+    "Usage:\n"
+    "  migrate-config                    # Interactive migration\n"
+    "  migrate-config -f config.json     # Migrate specific file\n"
+    "  migrate-config --dry-run          # Preview changes without applying\n"
+    "  migrate-config --interactive      # Force interactive mode\n"
+    "\n"
+    "Options:\n"
+    "  -f, --file FILE     Configuration file to migrate (default: config.json)\n"
+    "  -d, --dry-run       Show what would be changed without making changes\n"
+    "  -i, --interactive   Run in interactive mode\n"
+    "  -h, --help          Show this help message\n"
+    "\n"
+    "Examples:\n"
+    "  migrate-config                           # Interactive migration\n"
+    "  migrate-config -f my_config.json         # Migrate specific file\n"
+    "  migrate-config --dry-run                 # Preview migration",
+]))
+
+# Argument parser for migrate-config, built once and reused; help is shown by
+# _show_migrate_help and argument errors are reported instead of exiting.
+# Options must be spelled out in full: --dry is not taken as --dry-run
+MIGRATE_PARSER = argparse.ArgumentParser(
+    prog="migrate-config", add_help=False, exit_on_error=False, allow_abbrev=False
+)
+MIGRATE_PARSER.add_argument("-f", "--file", default="config.json")
+MIGRATE_PARSER.add_argument("-d", "--dry-run", action="store_true")
+MIGRATE_PARSER.add_argument("-i", "--interactive", action="store_true")
+MIGRATE_PARSER.add_argument("-h", "--help", action="store_true")
+
+# Built-in agent definitions, available even without a config file
+BUILTIN_AGENTS = {
+    "react": {
+        "class": "SpoonReactAI",
+        "aliases": ["spoon_react"],
+        "description": "A smart AI agent for blockchain operations"
+    },
+    "spoon_react_mcp": {
+        "class": "SpoonReactMCP",
+        "aliases": [],
+        "description": "SpoonReact agent with MCP protocol support"
+    }
+}
+
 class SpoonCommand:
     name: str
     description: str
@@ -104,13 +268,25 @@ class SpoonCommand:
         self.description = description
         self.handler = handler
         self.aliases = aliases
+        # Resolved once at registration so dispatch doesn't inspect the handler per call
+        self.is_async = asyncio.iscoroutinefunction(handler)
 
 class SpoonAICLI:
+    # Set once CHAT_LOG_DIR has been created in this process
+    _chat_log_dir_ready = False
+
     def __init__(self):
+        silence_third_party_loggers()
         self.agents = {}
         self.current_agent = None
         self.config_dir = Path(__file__).resolve().parents[1]
         self.commands: Dict[str, SpoonCommand] = {}
+        # Commands in registration order, without alias duplicates
+        self._primary_commands: List[SpoonCommand] = []
+        # Result of _get_available_agents, valid while the config file mtime is unchanged
+        self._available_agents_cache = None
+        self._agent_name_to_canonical: Dict[str, str] = {}
+        self._available_agents_mtime = None
         self.config_manager = ConfigManager()
 
         # Get blockchain configuration from environment variables
@@ -126,17 +302,41 @@ class SpoonAICLI:
         # Get SCAN_URL from config.json or environment
         scan_url = config_data.get("SCAN_URL") or os.getenv("SCAN_URL", "https://etherscan.io")
 
+        # The aggregator connects to the RPC endpoint, so it is only created
+        # on first use by a trade/token command (see the aggregator property)
+        self._rpc_url = rpc_url
+        self._chain_id = chain_id
+        self._scan_url = scan_url
+        self._aggregator = None
+        # LLM provider configuration, loaded by the startup warmup or the first llm-status
+        self._llm_config_manager = None
+        self._warmup_task = None
+        # Set tracked environment variables, see _get_env_snapshot
+        self._env_cache: Optional[Dict[str, str]] = None
+        # Account derived from PRIVATE_KEY by the transfer/swap commands
+        self._account_key = None
+        self._account_address = None
+        # Available commands per COMMAND_CATEGORIES group, see _get_category_counts
+        self._category_counts: Optional[Dict[str, int]] = None
+        # Parsed config files for check-config/validate-config, see _load_config_file
+        self._config_files: Dict[str, tuple] = {}
 
-
-        self.aggregator = Aggregator(
-            rpc_url=rpc_url,
-            chain_id=chain_id,
-            scan_url=scan_url
-        )
         self._should_exit = False
         self._init_commands()
-        self._set_prompt_toolkit()
-
+        # Prompt session, style and completer, created when an interactive loop starts
+        self.session = None
+
+
+    @property
+    def aggregator(self):
+        if self._aggregator is None:
+            from spoon_ai.trade.aggregator import Aggregator
+            self._aggregator = Aggregator(
+                rpc_url=self._rpc_url,
+                chain_id=self._chain_id,
+                scan_url=self._scan_url
+            )
+        return self._aggregator
 
     def _init_commands(self):
 
@@ -326,15 +526,17 @@ class SpoonAICLI:
     def add_command(self, command: SpoonCommand):
         # Store primary command
         self.commands[command.name] = command
+        self._primary_commands.append(command)
         # Store all aliases pointing to the same command
         for alias in command.aliases:
             self.commands[alias] = command
+        self._category_counts = None
 
     def _help(self, input_list: List[str]):
         if len(input_list) <= 1:
             # show all available commands
             logger.info("Available commands:")
-            for command in self.commands.values():
+            for command in self._primary_commands:
                 logger.info(f"  {command.name}: {command.description}")
         else:
             # show help for a specific command
@@ -356,42 +558,28 @@ class SpoonAICLI:
 
         name = input_list[0]
 
-        # Get available agents to validate the name
-        available_agents = self._get_available_agents()
-
         # Check if agent exists (by name or alias)
-        agent_found = False
-        if name in available_agents:
-            agent_found = True
-        else:
-            # Check aliases
-            for agent_name, config in available_agents.items():
-                if name in config.get("aliases", []):
-                    agent_found = True
-                    break
-
-        if not agent_found:
+        self._get_available_agents()
+        if name not in self._agent_name_to_canonical:
             logger.error(f"Agent '{name}' not found. Use 'list-agents' to see available agents.")
             return
 
         # Run the async load_agent method
         await self._load_agent(name)
 
+    def _get_config_mtime(self):
+        """Modification time of the config file, or None if it doesn't exist"""
+        try:
+            return os.stat(self.config_manager.config_path).st_mtime_ns
+        except OSError:
+            return None
+
     def _get_available_agents(self) -> Dict[str, Dict[str, Any]]:
         """Get available agents from unified configuration"""
-        # Built-in agent definitions
-        builtin_agents = {
-            "react": {
-                "class": "SpoonReactAI",
-                "aliases": ["spoon_react"],
-                "description": "A smart AI agent for blockchain operations"
-            },
-            "spoon_react_mcp": {
-                "class": "SpoonReactMCP",
-                "aliases": [],
-                "description": "SpoonReact agent with MCP protocol support"
-            }
-        }
+        # Reuse the previous result until the config file changes
+        config_mtime = self._get_config_mtime()
+        if self._available_agents_cache is not None and config_mtime == self._available_agents_mtime:
+            return self._available_agents_cache
 
         # Get agents from unified configuration
         try:
@@ -409,8 +597,18 @@ class SpoonAICLI:
             config_agents = {}
 
         # Merge built-in and config agents (config takes precedence)
-        available_agents = {**builtin_agents, **config_agents}
-
+        available_agents = {**BUILTIN_AGENTS, **config_agents}
+
+        # Map every agent name and alias to its canonical name
+        name_to_canonical = {}
+        for agent_name, agent_config in available_agents.items():
+            for alias in agent_config.get("aliases", []):
+                name_to_canonical.setdefault(alias, agent_name)
+        name_to_canonical.update((agent_name, agent_name) for agent_name in available_agents)
+
+        self._available_agents_cache = available_agents
+        self._agent_name_to_canonical = name_to_canonical
+        self._available_agents_mtime = config_mtime
         return available_agents
 
     async def _load_agent(self, name: str):
@@ -426,6 +624,7 @@ class SpoonAICLI:
             agent_class = agent_config.class_name
             agent_instance_config = agent_config.config
 
+            from spoon_ai.agents import SpoonReactAI, SpoonReactMCP
             if agent_class == "SpoonReactAI":
                 agent_instance = SpoonReactAI(**agent_instance_config)
             elif agent_class == "SpoonReactMCP":
@@ -488,7 +687,19 @@ class SpoonAICLI:
         logger.info(f"Loading default agent: {default_agent}")
         await self._load_agent(default_agent)
 
+    def _get_prompt_session(self):
+        """Return the interactive prompt session, creating it on first use"""
+        if self.session is None:
+            self._set_prompt_toolkit()
+        return self.session
+
     def _set_prompt_toolkit(self):
+        from prompt_toolkit import PromptSession
+        from prompt_toolkit.history import ThreadedHistory
+
+        from cli.completer import PrefixCompleter
+        from cli.history import BackgroundFileHistory
+
         self.style = Style.from_dict({
             'prompt': 'ansicyan bold',
             'command': 'ansigreen',
@@ -499,32 +710,33 @@ class SpoonAICLI:
 
         # Collect all command names and aliases
         all_names = set()
-        for cmd in self.commands.values():
+        for cmd in self._primary_commands:
             all_names.add(cmd.name)
             all_names.update(cmd.aliases)
 
-        self.completer = WordCompleter(
-            list(all_names),
-            ignore_case=True,
-        )
+        self.completer = PrefixCompleter(all_names)
         history_file = self.config_dir / "history.txt"
         history_file.touch(exist_ok=True)
         self.session = PromptSession(
             style=self.style,
             completer=self.completer,
-            history=FileHistory(history_file),
+            history=ThreadedHistory(BackgroundFileHistory(history_file)),
         )
 
     async def _handle_input(self, input_text: str):
+        # Let the startup warmup finish before the first command runs
+        if self._warmup_task is not None:
+            await self._warmup_task
+            self._warmup_task = None
         try:
             input_list = shlex.split(input_text)
             command_name = input_list[0]
             command = self.commands.get(command_name)
             if command:
-                if asyncio.iscoroutinefunction(command.handler):
-                    await command.handler(input_list[1:] if len(input_list) > 1 else [])
+                if command.is_async:
+                    await command.handler(input_list[1:])
                 else:
-                    command.handler(input_list[1:] if len(input_list) > 1 else [])
+                    command.handler(input_list[1:])
             else:
                 logger.error(f"Command {command_name} not found")
         except Exception as e:
@@ -552,8 +764,7 @@ class SpoonAICLI:
                     if action_args:
                         # If arguments provided, use the old behavior
                         # Check if current agent is SpoonReactAI
-                        from spoon_ai.agents.spoon_react import SpoonReactAI
-                        if isinstance(self.current_agent, SpoonReactAI):
+                        if isinstance(self.current_agent, get_spoon_react_cls()):
                             # For SpoonReactAI agents, use run method
                             res = await self.current_agent.run(action_args[0])
                         else:
@@ -571,12 +782,12 @@ class SpoonAICLI:
             elif action_name == "new":
                 self._handle_new_chat([])
             elif action_name == "list":
-                self._handle_list_chats([])
+                await self._handle_list_chats([])
             elif action_name == "load":
                 if len(action_args) != 1:
                     logger.error("Usage: action load <agent_name>")
                     return
-                self._handle_load_chat(action_args)
+                await self._handle_load_chat(action_args)
             else:
                 if hasattr(self.current_agent, "perform_action") and callable(getattr(self.current_agent, "perform_action", None)):
                     self.current_agent.perform_action(action_name, action_args)
@@ -586,19 +797,41 @@ class SpoonAICLI:
             logger.error(f"Error during action '{action_name}': {e}")
             logger.debug(traceback.format_exc())
 
+    def _recent_messages(self, messages) -> deque:
+        """Return the last history_window messages of a chat history"""
+        return deque(messages, maxlen=self.config_manager.get('history_window', DEFAULT_HISTORY_WINDOW))
+
+    @staticmethod
+    def _get_chat_messages(agent) -> List[Dict[str, Any]]:
+        """Return the message list backing an agent's chat history (plain list or metadata dict)
+
+        The list is complete and is what save_chat_history writes back, so it is never truncated.
+        """
+        if isinstance(agent.chat_history, list):
+            return agent.chat_history
+        return agent.chat_history.setdefault('messages', [])
+
     async def _start_interactive_chat(self):
         """Start an interactive chat session with the current agent."""
+        agent_name = self.current_agent.name
+        session_start = datetime.datetime.now()
+        started_at = session_start.isoformat(sep=' ', timespec='seconds')
+
         # Initialize chat history if not exists
         if not hasattr(self.current_agent, 'chat_history'):
             self.current_agent.chat_history = {
                 'metadata': {
-                    'agent_name': self.current_agent.name,
-                    'created_at': datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                    'updated_at': datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+                    'agent_name': agent_name,
+                    'created_at': started_at,
+                    'updated_at': started_at
                 },
                 'messages': []
             }
 
+        # Every read and append below goes through this list, whichever shape chat_history has
+        chat_messages = self._get_chat_messages(self.current_agent)
+        append_message = chat_messages.append
+
         # Create a new prompt session for chat
         chat_style = Style.from_dict({
             'agent': 'ansicyan bold',
@@ -610,69 +843,111 @@ class SpoonAICLI:
         })
 
         # Create a chat log file
-        chat_log_dir = Path('chat_logs')
-        chat_log_dir.mkdir(exist_ok=True)
-        timestamp = datetime.datetime.now().strftime('%Y%m%d_%H%M%S')
-        chat_log_file = chat_log_dir / f"chat_{self.current_agent.name}_{timestamp}.txt"
+        if not SpoonAICLI._chat_log_dir_ready:
+            CHAT_LOG_DIR.mkdir(exist_ok=True)
+            SpoonAICLI._chat_log_dir_ready = True
+        chat_log_file = f"{CHAT_LOG_DIR}/chat_{agent_name}_{session_start:%Y%m%d_%H%M%S}.txt"
 
         # Display welcome message
         logger.info("="*80)
-        logger.info(f"Starting chat with {self.current_agent.name}")
+        logger.info("Starting chat with %s", agent_name)
         logger.info("📝 Type your message and press Enter to send.")
         logger.info("🔄 Press Ctrl+C or Ctrl+D to exit chat mode and return to main CLI.")
-        logger.info(f"📋 Chat log will be saved to: {chat_log_file}")
+        logger.info("📋 Chat log will be saved to: %s", chat_log_file)
         logger.info("="*80 + "\n")
 
-        # Function to save chat to log file
-        def save_chat_to_log():
-            with open(chat_log_file, 'w') as f:
-                f.write(f"Chat session with {self.current_agent.name}\n")
-                f.write(f"Started at: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-
-                # Get message list
-                chat_messages = []
-                if isinstance(self.current_agent.chat_history, dict) and 'messages' in self.current_agent.chat_history:
-                    chat_messages = self.current_agent.chat_history.get('messages', [])
-                elif isinstance(self.current_agent.chat_history, list):
-                    chat_messages = self.current_agent.chat_history
-
-                for entry in chat_messages:
-                    if entry['role'] == 'user':
-                        f.write(f"You: {entry['content']}\n\n")
-                    else:
-                        f.write(f"{self.current_agent.name}: {entry['content']}\n\n")
-
-                f.write(f"\nChat ended at: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+        # Entries of chat_messages already written to the log file
+        logged_count = len(chat_messages)
 
-            self.current_agent.save_chat_history()
+        # Function to append history entries not yet written to the log file
+        def save_chat_to_log():
+            nonlocal logged_count
 
-        # Display chat history
-        chat_messages = []
-        if isinstance(self.current_agent.chat_history, dict) and 'messages' in self.current_agent.chat_history:
-            chat_messages = self.current_agent.chat_history.get('messages', [])
-        elif isinstance(self.current_agent.chat_history, list):
-            chat_messages = self.current_agent.chat_history
+            for entry in chat_messages[logged_count:]:
+                if entry['role'] == 'user':
+                    chat_log.write(f"You: {entry['content']}\n\n")
+                else:
+                    chat_log.write(f"{agent_name}: {entry['content']}\n\n")
+            logged_count = len(chat_messages)
+            chat_log.flush()
 
+        # Display the most recent part of the chat history
         if chat_messages:
             print_formatted_text(PromptHTML("<header>Chat History:</header>"), style=chat_style)
-            for entry in chat_messages:
-                if entry['role'] == 'user':
-                    print_formatted_text(PromptHTML(f"<user>You:</user> {entry['content']}"), style=chat_style)
-                else:
-                    print_formatted_text(PromptHTML(f"<agent>{self.current_agent.name}:</agent> {entry['content']}"), style=chat_style)
+            recent_messages = self._recent_messages(chat_messages)
+            if len(recent_messages) < len(chat_messages):
+                logger.info("(%d earlier messages not shown)", len(chat_messages) - len(recent_messages))
+            # Labels are built as formatted text fragments so message content isn't run through the markup parser
+            user_tag_prefix = FormattedText([('class:user', 'You:'), ('', ' ')])
+            agent_tag_prefix = FormattedText([('class:agent', f'{agent_name}:'), ('', ' ')])
+            for entry in recent_messages:
+                tag_prefix = user_tag_prefix if entry['role'] == 'user' else agent_tag_prefix
+                print_formatted_text(FormattedText(tag_prefix + [('', entry['content'])]), style=chat_style)
             logger.info("\n" + "-"*50 + "\n")
 
         # Check if current agent is SpoonReactAI
-        from spoon_ai.agents.spoon_react import SpoonReactAI
-        is_react_agent = isinstance(self.current_agent, SpoonReactAI)
+        is_react_agent = isinstance(self.current_agent, get_spoon_react_cls())
+
+        # Agent capabilities don't change during a session; check them once instead of per turn
+        has_astream = hasattr(self.current_agent, 'astream_chat_response')
+        has_reset_state = hasattr(self.current_agent, 'reset_state')
+        has_state = hasattr(self.current_agent, 'state')
+
+        # Per-turn labels are written as precomputed ANSI strings rather than
+        # re-parsing PromptHTML markup on every turn
+        thinking_line = f"{ANSI_THINKING}{agent_name} is thinking...{ANSI_RESET}\n"
+        agent_label = f"{ANSI_AGENT}{agent_name}:{ANSI_RESET} "
+
+        # Matches the "<agent name>: " prefix some agents echo at the start of a streamed reply
+        agent_name_prefix = f"{agent_name}: "
+        agent_name_prefix_re = re.compile(re.escape(agent_name_prefix), re.IGNORECASE)
+
+        def reset_agent_state():
+            if CLI_DEBUG:
+                cli_debug_log("Resetting agent state to IDLE")
+            if has_reset_state:
+                self.current_agent.reset_state()
+            elif has_state:
+                self.current_agent.state = AgentState.IDLE
+                self.current_agent.current_step = 0
+
+        # Non-streaming path used when streaming returns nothing or fails
+        async def respond_without_streaming(user_message):
+            if is_react_agent:
+                response = await self.current_agent.run(user_message)
+            else:
+                response = self.current_agent._generate_response(user_message)
+            if CLI_DEBUG:
+                cli_debug_log(f"Got non-streaming response of length {len(response)}")
+
+            # Remove the agent name some agents prepend to their reply
+            response = response.removeprefix(agent_name_prefix)
+
+            # Add to history
+            append_message({
+                'role': 'assistant',
+                'content': response
+            })
+
+            # Display response
+            sys.stdout.write(f"{agent_label}{response}\n")
+            sys.stdout.flush()
+
+        session = self._get_prompt_session()
+
+        # Open the chat log once for the whole session; each turn is appended as it happens.
+        # Opened right before the loop so the finally block below always closes it
+        chat_log = open(chat_log_file, 'a', buffering=8192)
 
         # Start chat loop
         try:
+            chat_log.write(f"Chat session with {agent_name}\n")
+            chat_log.write(f"Started at: {started_at}\n\n")
             while True:
                 try:
                     # Get user input
-                    user_message = await self.session.prompt_async(
-                        PromptHTML("<user>You</user> > "),
+                    user_message = await session.prompt_async(
+                        USER_PROMPT,
                         style=self.style,
                     )
 
@@ -681,61 +956,60 @@ class SpoonAICLI:
                         continue
 
                     # Add to history
-                    if isinstance(self.current_agent.chat_history, dict) and 'messages' in self.current_agent.chat_history:
-                        self.current_agent.chat_history['messages'].append({
-                            'role': 'user',
-                            'content': user_message
-                        })
-                    else:
-                        self.current_agent.chat_history.append({
-                            'role': 'user',
-                            'content': user_message
-                        })
+                    append_message({
+                        'role': 'user',
+                        'content': user_message
+                    })
 
                     # Get response from agent
-                    print_formatted_text(PromptHTML(f"<thinking>{self.current_agent.name} is thinking...</thinking>"), style=chat_style)
+                    sys.stdout.write(thinking_line)
+                    sys.stdout.flush()
 
                     # Use streaming response if available
                     try:
                         # Define a simpler streaming function
                         async def stream_response():
-                            cli_debug_log("Starting stream_response function")
+                            if CLI_DEBUG:
+                                cli_debug_log("Starting stream_response function")
 
                             # Display agent name
-                            print_formatted_text(
-                                PromptHTML(f"<agent>{self.current_agent.name}:</agent>"),
-                                style=chat_style,
-                                end=" "
-                            )
+                            sys.stdout.write(agent_label)
+                            sys.stdout.flush()
 
-                            # Collect the full response
+                            # Collect the streamed chunks; they are joined once at the end
                             full_response = ""
+                            parts = []
                             chunk_count = 0
-                            agent_name_prefix = f"{self.current_agent.name}: "
-                            agent_name_prefix_lower = agent_name_prefix.lower()
 
                             # Stream the response
-                            cli_debug_log("Starting to stream response")
+                            if CLI_DEBUG:
+                                cli_debug_log("Starting to stream response")
+                            last_flush = time.monotonic()
                             try:
-                                if hasattr(self.current_agent, 'astream_chat_response'):
+                                if has_astream:
                                     async for chunk in self.current_agent.astream_chat_response(user_message):
                                         if chunk:
                                             chunk_count += 1
-                                            cli_debug_log(f"Received chunk #{chunk_count}: {chunk[:20]}...")
+                                            if CLI_DEBUG:
+                                                cli_debug_log(f"Received chunk #{chunk_count}: {chunk[:20]}...")
 
-                                            # Check if first chunk starts with agent name and remove it
+                                            # Check if first chunk starts with agent name (any case) and remove it
                                             if chunk_count == 1:
-                                                # Check for exact match
-                                                if chunk.startswith(agent_name_prefix):
-                                                    chunk = chunk[len(agent_name_prefix):]
-                                                    cli_debug_log(f"Removed agent name prefix from chunk")
-                                                # Check for case-insensitive match
-                                                elif chunk.lower().startswith(agent_name_prefix_lower):
-                                                    chunk = chunk[len(agent_name_prefix):]
-                                                    cli_debug_log(f"Removed case-insensitive agent name prefix from chunk")
-
-                                            full_response += chunk
-                                            print(chunk, end="", flush=True)
+                                                prefix_match = agent_name_prefix_re.match(chunk)
+                                                if prefix_match:
+                                                    chunk = chunk[prefix_match.end():]
+                                                    if CLI_DEBUG:
+                                                        cli_debug_log(f"Removed agent name prefix from chunk")
+
+                                            parts.append(chunk)
+                                            sys.stdout.write(chunk)
+                                            # Flush on line/sentence boundaries or once the interval elapses
+                                            now = time.monotonic()
+                                            if (now - last_flush >= STREAM_FLUSH_INTERVAL
+                                                    or chunk.endswith(STREAM_FLUSH_ENDINGS)):
+                                                sys.stdout.flush()
+                                                last_flush = now
+                                    full_response = "".join(parts)
                                 else:
                                     # For SpoonReactAI which doesn't have astream_chat_response
                                     if is_react_agent:
@@ -743,16 +1017,21 @@ class SpoonAICLI:
                                         print(full_response)
                                         chunk_count = 1
 
-                                cli_debug_log(f"Finished streaming, received {chunk_count} chunks")
+                                sys.stdout.flush()
+                                if CLI_DEBUG:
+                                    cli_debug_log(f"Finished streaming, received {chunk_count} chunks")
 
                                 # Ensure a new line after the response
                                 if chunk_count > 0:
                                     print()
                             except Exception as e:
-                                cli_debug_log(f"Error during streaming iteration: {e}")
+                                if CLI_DEBUG:
+                                    cli_debug_log(f"Error during streaming iteration: {e}")
                                 print(f"\nError during streaming: {e}")
+                                full_response = full_response or "".join(parts)
                                 if not full_response:
-                                    cli_debug_log("No response received, using non-streaming")
+                                    if CLI_DEBUG:
+                                        cli_debug_log("No response received, using non-streaming")
                                     print("Using non-streaming response...")
                                     if is_react_agent:
                                         full_response = await self.current_agent.run(user_message)
@@ -763,109 +1042,52 @@ class SpoonAICLI:
                             return full_response
 
                         # Run the streaming function
-                        cli_debug_log("Running stream_response function")
+                        if CLI_DEBUG:
+                            cli_debug_log("Running stream_response function")
                         response = await stream_response()
-                        cli_debug_log(f"Stream response completed, got response of length {len(response)}")
+                        if CLI_DEBUG:
+                            cli_debug_log(f"Stream response completed, got response of length {len(response)}")
 
                         # Add to history if we got a response
                         if response:
-                            cli_debug_log("Adding streaming response to chat history")
-                            if isinstance(self.current_agent.chat_history, dict) and 'messages' in self.current_agent.chat_history:
-                                self.current_agent.chat_history['messages'].append({
-                                    'role': 'assistant',
-                                    'content': response
-                                })
-                            else:
-                                self.current_agent.chat_history.append({
-                                    'role': 'assistant',
-                                    'content': response
-                                })
+                            if CLI_DEBUG:
+                                cli_debug_log("Adding streaming response to chat history")
+                            append_message({
+                                'role': 'assistant',
+                                'content': response
+                            })
                         else:
                             # Fallback if streaming returned empty
-                            cli_debug_log("Streaming returned empty response, falling back to non-streaming")
+                            if CLI_DEBUG:
+                                cli_debug_log("Streaming returned empty response, falling back to non-streaming")
                             logger.info("Streaming returned empty response, falling back to non-streaming...")
-                            if is_react_agent:
-                                response = await self.current_agent.run(user_message)
-                            else:
-                                response = self.current_agent._generate_response(user_message)
-                            cli_debug_log(f"Got non-streaming response of length {len(response)}")
-
-                            # Check if response starts with agent name and remove it
-                            agent_name_prefix = f"{self.current_agent.name}: "
-                            if response.startswith(agent_name_prefix):
-                                response = response[len(agent_name_prefix):]
-                                cli_debug_log(f"Removed agent name prefix from non-streaming response")
-
-                            # Add to history
-                            if isinstance(self.current_agent.chat_history, dict) and 'messages' in self.current_agent.chat_history:
-                                self.current_agent.chat_history['messages'].append({
-                                    'role': 'assistant',
-                                    'content': response
-                                })
-                            else:
-                                self.current_agent.chat_history.append({
-                                    'role': 'assistant',
-                                    'content': response
-                                })
-
-                            # Display response
-                            print_formatted_text(PromptHTML(f"<agent>{self.current_agent.name}:</agent> {response}"), style=chat_style)
+                            await respond_without_streaming(user_message)
 
                         # Reset agent state to IDLE after response is processed
-                        cli_debug_log("Resetting agent state to IDLE")
-                        if hasattr(self.current_agent, 'reset_state'):
-                            self.current_agent.reset_state()
-                        elif hasattr(self.current_agent, 'state'):
-                            from spoon_ai.schema import AgentState
-                            self.current_agent.state = AgentState.IDLE
-                            self.current_agent.current_step = 0
+                        reset_agent_state()
 
                     except Exception as e:
                         # Fallback to non-streaming if streaming not available or failed
-                        cli_debug_log(f"Streaming failed with error: {e}")
-                        logger.info(f"Streaming failed: {e}. Using non-streaming response...")
-                        if is_react_agent:
-                            response = await self.current_agent.run(user_message)
-                        else:
-                            response = self.current_agent._generate_response(user_message)
-                        cli_debug_log(f"Got non-streaming response of length {len(response)}")
-
-                        # Check if response starts with agent name and remove it
-                        agent_name_prefix = f"{self.current_agent.name}: "
-                        if response.startswith(agent_name_prefix):
-                            response = response[len(agent_name_prefix):]
-                            cli_debug_log(f"Removed agent name prefix from non-streaming response")
-
-                        # Add to history
-                        if isinstance(self.current_agent.chat_history, dict) and 'messages' in self.current_agent.chat_history:
-                            self.current_agent.chat_history['messages'].append({
-                                'role': 'assistant',
-                                'content': response
-                            })
-                        else:
-                            self.current_agent.chat_history.append({
-                                'role': 'assistant',
-                                'content': response
-                            })
-
-                        # Display response
-                        print_formatted_text(PromptHTML(f"<agent>{self.current_agent.name}:</agent> {response}"), style=chat_style)
+                        if CLI_DEBUG:
+                            cli_debug_log(f"Streaming failed with error: {e}")
+                        logger.info("Streaming failed: %s. Using non-streaming response...", e)
+                        await respond_without_streaming(user_message)
 
                         # Reset agent state to IDLE after response is processed
-                        cli_debug_log("Resetting agent state to IDLE")
-                        if hasattr(self.current_agent, 'reset_state'):
-                            self.current_agent.reset_state()
-                        elif hasattr(self.current_agent, 'state'):
-                            from spoon_ai.schema import AgentState
-                            self.current_agent.state = AgentState.IDLE
-                            self.current_agent.current_step = 0
+                        reset_agent_state()
+
+                    # Append this turn to the chat log
+                    save_chat_to_log()
 
                 except (KeyboardInterrupt, EOFError):
                     logger.info("\nExiting chat mode...")
                     break
         finally:
-            # Save chat log when exiting
+            # Write any remaining entries and close the chat log when exiting
             save_chat_to_log()
+            chat_log.write(f"\nChat ended at: {datetime.datetime.now().isoformat(sep=' ', timespec='seconds')}\n")
+            chat_log.close()
+            await asyncio.to_thread(self.current_agent.save_chat_history)
             print_formatted_text(
                 PromptHTML(f"<info>Chat log saved to: {chat_log_file}</info>"),
                 style=chat_style
@@ -875,9 +1097,8 @@ class SpoonAICLI:
     async def _start_interactive_react(self):
         """Start an interactive react session with the current agent."""
         # Check if current agent is a ReActAgent
-        from spoon_ai.agents.react import ReActAgent
-        if not isinstance(self.current_agent, ReActAgent):
-            logger.warning(f"Current agent {self.current_agent.name} is not a ReActAgent. Switching to chat mode.")
+        if not isinstance(self.current_agent, get_react_agent_cls()):
+            logger.warning("Current agent %s is not a ReActAgent. Switching to chat mode.", self.current_agent.name)
             await self._start_interactive_chat()
             return
 
@@ -894,46 +1115,62 @@ class SpoonAICLI:
         # Create a react log file
         react_log_dir = Path('react_logs')
         react_log_dir.mkdir(exist_ok=True)
-        timestamp = datetime.datetime.now().strftime('%Y%m%d_%H%M%S')
-        react_log_file = react_log_dir / f"react_{self.current_agent.name}_{timestamp}.txt"
+        session_start = datetime.datetime.now()
+        started_at = session_start.isoformat(sep=' ', timespec='seconds')
+        react_log_file = react_log_dir / f"react_{self.current_agent.name}_{session_start:%Y%m%d_%H%M%S}.txt"
 
         # Display welcome message
         logger.info("="*80)
-        logger.info(f"Starting react session with {self.current_agent.name}")
+        logger.info("Starting react session with %s", self.current_agent.name)
         logger.info("📝 Type your message and press Enter to send.")
         logger.info("🔄 Press Ctrl+C or Ctrl+D to exit react mode and return to main CLI.")
-        logger.info(f"📋 React log will be saved to: {react_log_file}")
+        logger.info("📋 React log will be saved to: %s", react_log_file)
         logger.info("⚠️ Note: This session will not save chat history.")
         logger.info("="*80 + "\n")
 
-        # Function to save react to log file
-        def save_react_to_log():
-            with open(react_log_file, 'w') as f:
-                f.write(f"React session with {self.current_agent.name}\n")
-                f.write(f"Started at: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+        def get_react_messages():
+            memory = getattr(self.current_agent, 'memory', None)
+            return getattr(memory, 'messages', None) or []
+
+        # Function to append the memory messages added since previous_messages to the log file.
+        # Messages are matched by identity because memory drops its oldest entries once full.
+        def save_react_to_log(previous_messages):
+            previous_ids = {id(message) for message in previous_messages}
+            for message in get_react_messages():
+                if id(message) in previous_ids:
+                    continue
+                if message.role == Role.USER:
+                    react_log.write(f"You: {message.content}\n\n")
+                elif message.role == Role.ASSISTANT:
+                    react_log.write(f"{self.current_agent.name}: {message.content}\n\n")
+                elif message.role == Role.TOOL:
+                    react_log.write(f"Tool: {message.content}\n\n")
+            react_log.flush()
 
-                # Get message list
-                react_messages = []
-                if hasattr(self.current_agent, 'memory') and hasattr(self.current_agent.memory, 'messages'):
-                    react_messages = self.current_agent.memory.messages
+        # Messages present when the current turn started, or None between turns
+        turn_start_messages = None
 
-                for message in react_messages:
-                    if message.role == Role.USER:
-                        f.write(f"You: {message.content}\n\n")
-                    elif message.role == Role.ASSISTANT:
-                        f.write(f"{self.current_agent.name}: {message.content}\n\n")
-                    elif message.role == Role.TOOL:
-                        f.write(f"Tool: {message.content}\n\n")
+        # Per-turn labels, built once for the session
+        thinking_text = FormattedText([('class:thinking', f'{self.current_agent.name} is thinking...')])
+        agent_tag_prefix = FormattedText([('class:agent', f'{self.current_agent.name}:'), ('', ' ')])
 
-                f.write(f"\nReact session ended at: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+        session = self._get_prompt_session()
+
+        # Open the react log once for the whole session; each turn is appended as it completes.
+        # Opened right before the loop so the finally block below always closes it
+        react_log = open(react_log_file, 'a', buffering=8192)
 
         # Start react loop
         try:
+            react_log.write(f"React session with {self.current_agent.name}\n")
+            react_log.write(f"Started at: {started_at}\n\n")
+            # Messages already in memory are logged up front, as the end-of-session dump used to
+            save_react_to_log(())
             while True:
                 try:
                     # Get user input
-                    user_message = await self.session.prompt_async(
-                        PromptHTML("<user>You</user> > "),
+                    user_message = await session.prompt_async(
+                        USER_PROMPT,
                         style=self.style,
                     )
 
@@ -946,13 +1183,14 @@ class SpoonAICLI:
                     # self.current_agent.add_message("user", user_message)
 
                     # Get response from agent
-                    print_formatted_text(PromptHTML(f"<thinking>{self.current_agent.name} is thinking...</thinking>"), style=react_style)
+                    print_formatted_text(thinking_text, style=react_style)
 
                     # Run the ReAct agent's step method
+                    turn_start_messages = list(get_react_messages())
                     result = await self.current_agent.run(user_message)
 
                     # Display the result
-                    print_formatted_text(PromptHTML(f"<agent>{self.current_agent.name}:</agent> {result}"), style=react_style)
+                    print_formatted_text(FormattedText(agent_tag_prefix + [('', str(result))]), style=react_style)
 
                     # Reset the agent state
                     if hasattr(self.current_agent, 'reset_state'):
@@ -961,25 +1199,48 @@ class SpoonAICLI:
                         self.current_agent.state = AgentState.IDLE
                         self.current_agent.current_step = 0
 
+                    # Append this turn to the react log
+                    save_react_to_log(turn_start_messages)
+                    turn_start_messages = None
+
                 except (KeyboardInterrupt, EOFError):
                     logger.info("\nExiting react mode...")
                     break
         finally:
-            # Save react log when exiting
-            save_react_to_log()
+            # Log any unfinished turn and close the react log when exiting
+            if turn_start_messages is not None:
+                save_react_to_log(turn_start_messages)
+            react_log.write(f"\nReact session ended at: {datetime.datetime.now().isoformat(sep=' ', timespec='seconds')}\n")
+            react_log.close()
             print_formatted_text(
                 PromptHTML(f"<info>React log saved to: {react_log_file}</info>"),
                 style=react_style
             )
             print("="*50 + "\n")
 
+    def _get_llm_config_manager(self):
+        """Return the LLM ConfigurationManager, loading .env and the config file on first use"""
+        if self._llm_config_manager is None:
+            from spoon_ai.llm.config import ConfigurationManager
+            self._llm_config_manager = ConfigurationManager()
+        return self._llm_config_manager
+
+    async def _warmup(self):
+        """Load the LLM provider configuration in a worker thread while the user types"""
+        try:
+            await asyncio.to_thread(lambda: self._get_llm_config_manager().get_available_providers_by_priority())
+        except Exception as e:
+            logger.debug("LLM configuration warmup failed: %s", e)
+
     async def run(self):
         await self._load_default_agent()
+        self._warmup_task = asyncio.create_task(self._warmup())
         self._should_exit = False
+        session = self._get_prompt_session()
 
         while not self._should_exit:
             try:
-                input_text = await self.session.prompt_async(
+                input_text = await session.prompt_async(
                     self._get_prompt(),
                     style=self.style,
                 )
@@ -1009,53 +1270,83 @@ class SpoonAICLI:
             return
 
         # Reset chat history with metadata
+        now = datetime.datetime.now().isoformat(sep=' ', timespec='seconds')
         self.current_agent.chat_history = {
             'metadata': {
                 'agent_name': self.current_agent.name,
-                'created_at': datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                'updated_at': datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+                'created_at': now,
+                'updated_at': now
             },
             'messages': []
         }
 
         logger.info(f"Started new chat with {self.current_agent.name} (chat history cleared)")
 
-    def _handle_list_chats(self, input_list: List[str]):
-        chat_logs_dir = Path('chat_logs')
-        if not chat_logs_dir.exists():
-            logger.info("No chat histories found")
-            return
+    async def _handle_list_chats(self, input_list: List[str]):
+        # One directory scan gives the mtimes of both histories and their metadata sidecars
+        try:
+            with os.scandir(CHAT_LOG_DIR) as entries:
+                mtimes = {
+                    entry.name: entry.stat(follow_symlinks=False).st_mtime
+                    for entry in entries
+                    if entry.name.endswith(('_history.json', '_history.meta.json'))
+                }
+        except FileNotFoundError:
+            mtimes = {}
 
-        chat_files = list(chat_logs_dir.glob('*_history.json'))
-        if not chat_files:
+        chat_names = [name for name in mtimes if name.endswith('_history.json')]
+        if not chat_names:
             logger.info("No chat histories found")
             return
 
         logger.info("Available chat histories:")
-        for chat_file in chat_files:
-            agent_name = chat_file.stem.replace('_history', '')
+        for chat_name in chat_names:
+            agent_name = chat_name[:-len('_history.json')]
+            meta_mtime = mtimes.get(f'{agent_name}_history.meta.json')
             try:
-                with open(chat_file, 'r', encoding='utf-8') as f:
-                    history = json.load(f)
-                    msg_count = len(history)
-                    if msg_count > 0:
-                        first_date = "Unknown"
-                        last_date = "Unknown"
-
-                        if 'metadata' in history and 'created_at' in history['metadata']:
-                            first_date = history['metadata']['created_at']
-                            last_date = history['metadata'].get('updated_at', first_date)
-                        else:
-                            file_time = datetime.datetime.fromtimestamp(chat_file.stat().st_mtime)
-                            last_date = file_time.strftime('%Y-%m-%d')
-
-                        logger.info(f"  {agent_name}: {msg_count} messages ({first_date} - {last_date})")
-                    else:
-                        logger.info(f"  {agent_name}: Empty chat history")
+                msg_count, first_date, last_date = await asyncio.to_thread(
+                    self._read_chat_summary, CHAT_LOG_DIR / chat_name, mtimes[chat_name], meta_mtime
+                )
+                if msg_count > 0:
+                    logger.info("  %s: %s messages (%s - %s)", agent_name, msg_count, first_date, last_date)
+                else:
+                    logger.info("  %s: Empty chat history", agent_name)
             except Exception as e:
-                logger.info(f"  {agent_name}: Error reading history - {e}")
+                logger.info("  %s: Error reading history - %s", agent_name, e)
+
+    @staticmethod
+    def _read_chat_summary(chat_file: Path, chat_mtime: float, meta_mtime: Optional[float]):
+        """Return (message count, created_at, updated_at) for a saved chat history.
+
+        Reads the small <agent>_history.meta.json sidecar written by
+        save_chat_history when it is at least as new as the history file,
+        and only parses the full history otherwise.
+        """
+        if meta_mtime is not None and meta_mtime >= chat_mtime:
+            try:
+                meta = orjson.loads(chat_file.with_name(chat_file.stem + '.meta.json').read_bytes())
+                created_at = meta.get('created_at', "Unknown")
+                return meta['msg_count'], created_at, meta.get('updated_at', created_at)
+            except (OSError, ValueError, KeyError):
+                pass
+
+        history = orjson.loads(chat_file.read_bytes())
+        if isinstance(history, dict):
+            msg_count = len(history.get('messages', []))
+            metadata = history.get('metadata', {})
+        else:
+            msg_count = len(history)
+            metadata = {}
+
+        if 'created_at' in metadata:
+            first_date = metadata['created_at']
+            last_date = metadata.get('updated_at', first_date)
+        else:
+            first_date = "Unknown"
+            last_date = datetime.date.fromtimestamp(chat_mtime).isoformat()
+        return msg_count, first_date, last_date
 
-    def _handle_load_chat(self, input_list: List[str]):
+    async def _handle_load_chat(self, input_list: List[str]):
         if not self.current_agent:
             logger.error("No agent loaded")
             return
@@ -1072,10 +1363,9 @@ class SpoonAICLI:
             return
 
         try:
-            with open(chat_file, 'r', encoding='utf-8') as f:
-                history = json.load(f)
+            history = orjson.loads(await asyncio.to_thread(chat_file.read_bytes))
 
-            self.current_agent.save_chat_history()
+            await asyncio.to_thread(self.current_agent.save_chat_history)
 
             self.current_agent.chat_history = history
             logger.info(f"Loaded chat history from {agent_name} ({len(history)} messages)")
@@ -1154,65 +1444,64 @@ class SpoonAICLI:
     def _handle_llm_status(self, input_list: List[str]):
         """Handle LLM status command to show provider configuration and availability"""
         try:
-            from spoon_ai.llm.config import ConfigurationManager
+            config_manager = self._get_llm_config_manager()
 
-            config_manager = ConfigurationManager()
-
-            logger.info("=" * 60)
-            logger.info("LLM PROVIDER STATUS")
-            logger.info("=" * 60)
+            # The status block is collected and logged as one record
+            lines = ["=" * 60, "LLM PROVIDER STATUS", "=" * 60]
 
             # Show current default provider
-            default_provider = config_manager.get_default_provider()
-            logger.info(f"Current Default Provider: {default_provider}")
+            lines.append(f"Current Default Provider: {config_manager.get_default_provider()}")
 
             # Show available providers by priority
             available_providers = config_manager.get_available_providers_by_priority()
             if available_providers:
-                logger.info(f"Available Providers (by priority): {', '.join(available_providers)}")
+                lines.append(f"Available Providers (by priority): {', '.join(available_providers)}")
             else:
                 logger.warning("No providers with valid API keys found!")
 
             # Show detailed provider information
-            logger.info("\nProvider Details:")
+            lines.append("\nProvider Details:")
             provider_info = config_manager.get_provider_info()
 
             for provider, info in provider_info.items():
                 status_icon = "Available" if info['available'] else "Not Available"
-                logger.info(f"  {provider.upper()}: {status_icon}")
+                lines.append(f"  {provider.upper()}: {status_icon}")
 
                 if info['available']:
-                    logger.info(f"    Model: {info['model']}")
+                    lines.append(f"    Model: {info['model']}")
                     if info.get('base_url'):
-                        logger.info(f"    Base URL: {info['base_url']}")
-                    logger.info(f"    Configured via: {info['configured_via']}")
+                        lines.append(f"    Base URL: {info['base_url']}")
+                    lines.append(f"    Configured via: {info['configured_via']}")
                 else:
                     if 'error' in info:
-                        logger.info(f"    Error: {info['error']}")
+                        lines.append(f"    Error: {info['error']}")
 
             # Show current agent's LLM configuration
             if self.current_agent and hasattr(self.current_agent, 'llm'):
-                logger.info(f"\nCurrent Agent LLM:")
+                lines.append("\nCurrent Agent LLM:")
                 llm = self.current_agent.llm
                 if hasattr(llm, 'use_llm_manager'):
                     architecture = "New LLM Manager" if llm.use_llm_manager else "Legacy"
-                    logger.info(f"    Architecture: {architecture}")
+                    lines.append(f"    Architecture: {architecture}")
                 if hasattr(llm, 'llm_provider'):
-                    logger.info(f"    Provider: {llm.llm_provider}")
+                    lines.append(f"    Provider: {llm.llm_provider}")
                 if hasattr(llm, 'model_name'):
-                    logger.info(f"    Model: {llm.model_name}")
+                    lines.append(f"    Model: {llm.model_name}")
 
             # Show configuration tips
-            logger.info("\nConfiguration Tips:")
-            logger.info("  • Set DEFAULT_LLM_PROVIDER environment variable to override default selection")
-            logger.info("  • Configure API keys in .env file or environment variables")
-            logger.info("  • Provider priority: anthropic > openai > gemini")
-            logger.info("  • Use 'config' command to manage other settings")
+            lines.extend([
+                "\nConfiguration Tips:",
+                "  • Set DEFAULT_LLM_PROVIDER environment variable to override default selection",
+                "  • Configure API keys in .env file or environment variables",
+                "  • Provider priority: anthropic > openai > gemini",
+                "  • Use 'config' command to manage other settings",
+                "=" * 60,
+            ])
 
-            logger.info("=" * 60)
+            logger.info("\n".join(lines))
 
         except Exception as e:
-            logger.error(f"Error getting LLM status: {e}")
+            logger.error("Error getting LLM status: %s", e)
             import traceback
             logger.debug(traceback.format_exc())
 
@@ -1228,6 +1517,10 @@ class SpoonAICLI:
 
             # Reload configuration manager
             self.config_manager = ConfigManager()
+            self._available_agents_cache = None
+            self._llm_config_manager = None
+            self._env_cache = None
+            self._invalidate_config_cache()
 
             # Get current agent name
             agent_name = self.current_agent.name
@@ -1241,7 +1534,31 @@ class SpoonAICLI:
             logger.error(f"Failed to reload configuration: {e}")
             logger.debug(f"Config reload error details: {e}", exc_info=True)
 
-    def _handle_transfer(self, input_list: List[str]):
+    async def _get_aggregator(self):
+        """Return the aggregator, connecting to the RPC endpoint in a worker thread on first use"""
+        if self._aggregator is None:
+            await asyncio.to_thread(lambda: self.aggregator)
+        return self._aggregator
+
+    def _get_account_address(self, private_key: str) -> str:
+        """Return the account address for private_key, deriving it only when the key changes"""
+        if self._account_key != private_key:
+            self._account_address = self.aggregator._web3.eth.account.from_key(private_key).address
+            self._account_key = private_key
+        return self._account_address
+
+    @staticmethod
+    async def _confirm(message: str) -> bool:
+        """Ask a y/n question on the event loop, where Ctrl+C can still interrupt it"""
+        from prompt_toolkit import PromptSession
+
+        try:
+            answer = await PromptSession().prompt_async(message)
+        except (KeyboardInterrupt, EOFError):
+            return False
+        return answer.strip().lower() == 'y'
+
+    async def _handle_transfer(self, input_list: List[str]):
         """
         Handle the transfer command
         Usage: transfer <to_address> <amount> [token_address]
@@ -1272,8 +1589,8 @@ class SpoonAICLI:
                 print("PRIVATE_KEY is not set in environment variables")
                 return
 
-            account = self.aggregator._web3.eth.account.from_key(private_key)
-            account_address = account.address
+            aggregator = await self._get_aggregator()
+            account_address = await asyncio.to_thread(self._get_account_address, private_key)
 
             # Confirm transaction details with user
             token_name = "Native Token" if not token_address else token_address
@@ -1282,19 +1599,18 @@ class SpoonAICLI:
             print(f"To: {to_address}")
             print(f"Amount: {amount} {token_name}")
 
-            confirm = input("Confirm transaction? (y/n): ")
-            if confirm.lower() != 'y':
+            if not await self._confirm("Confirm transaction? (y/n): "):
                 print("Transaction cancelled")
                 return
 
             # Execute transfer
-            tx_hash = self.aggregator.transfer(to_address, amount, token_address)
+            tx_hash = await asyncio.to_thread(aggregator.transfer, to_address, amount, token_address)
             print(f"Transaction sent! Transaction hash: {tx_hash}")
 
         except Exception as e:
             print(f"Transfer failed: {str(e)}")
 
-    def _handle_swap(self, input_list: List[str]):
+    async def _handle_swap(self, input_list: List[str]):
         """
         Handle the swap command
         Usage: swap <token_in> <token_out> <amount> [slippage]
@@ -1330,12 +1646,14 @@ class SpoonAICLI:
                 print("PRIVATE_KEY is not set in environment variables")
                 return
 
-            account = self.aggregator._web3.eth.account.from_key(private_key)
-            account_address = account.address
+            aggregator = await self._get_aggregator()
+            account_address = await asyncio.to_thread(self._get_account_address, private_key)
 
             # Get current balance
-            current_balance = self.aggregator.get_balance(
-                token_address=None if token_in.lower() == self.aggregator.get_native_token_address().lower() else token_in
+            native_token = aggregator.get_native_token_address()
+            current_balance = await asyncio.to_thread(
+                aggregator.get_balance,
+                token_address=None if token_in.lower() == native_token.lower() else token_in
             )
 
             # Confirm transaction details with user
@@ -1346,19 +1664,18 @@ class SpoonAICLI:
             print(f"Slippage: {slippage}%")
             print(f"Current Balance: {current_balance} {token_in}")
 
-            confirm = input("Confirm swap? (y/n): ")
-            if confirm.lower() != 'y':
+            if not await self._confirm("Confirm swap? (y/n): "):
                 print("Swap cancelled")
                 return
 
             # Execute swap
-            result = self.aggregator.swap(token_in, token_out, amount, slippage)
+            result = await asyncio.to_thread(aggregator.swap, token_in, token_out, amount, slippage)
             print(result)
 
         except Exception as e:
             print(f"Swap failed: {str(e)}")
 
-    def _handle_token_info_by_address(self, input_list: List[str]):
+    async def _handle_token_info_by_address(self, input_list: List[str]):
         """
         Handle the token-info command
         Usage: token-info <token_address>
@@ -1370,7 +1687,8 @@ class SpoonAICLI:
         token_address = input_list[0]
 
         try:
-            token_info = self.aggregator.get_token_info_by_address(token_address)
+            aggregator = await self._get_aggregator()
+            token_info = await asyncio.to_thread(aggregator.get_token_info_by_address, token_address)
             if token_info:
                 print("\nToken Information:")
                 print(f"Name: {token_info.get('name')}")
@@ -1393,7 +1711,7 @@ class SpoonAICLI:
         except Exception as e:
             print(f"Error getting token information: {str(e)}")
 
-    def _handle_token_info_by_symbol(self, input_list: List[str]):
+    async def _handle_token_info_by_symbol(self, input_list: List[str]):
         """
         Handle the token-by-symbol command
         Usage: token-by-symbol <symbol>
@@ -1405,7 +1723,8 @@ class SpoonAICLI:
         symbol = input_list[0]
 
         try:
-            token_info = self.aggregator.get_token_info_by_symbol(symbol)
+            aggregator = await self._get_aggregator()
+            token_info = await asyncio.to_thread(aggregator.get_token_info_by_symbol, symbol)
             if token_info:
                 print("\nToken Information:")
                 print(f"Name: {token_info.get('name')}")
@@ -1424,11 +1743,11 @@ class SpoonAICLI:
                 if 'image' in token_info and token_info['image']:
                     print(f"Image URL: {token_info['image']}")
             else:
-                print(f"No token found with symbol: {symbol} on network: {self.aggregator.network}")
+                print(f"No token found with symbol: {symbol} on network: {aggregator.network}")
         except Exception as e:
             print(f"Error getting token information: {str(e)}")
 
-    def _handle_load_docs(self, input_list: List[str]):
+    async def _handle_load_docs(self, input_list: List[str]):
         """Handle the load-docs command"""
         if not self.current_agent:
             print("No agent loaded. Please load an agent first.")
@@ -1446,7 +1765,7 @@ class SpoonAICLI:
             print("\nExamples:")
             print("  load-docs /path/to/documents")
             print("  load-docs /path/to/documents \"**/*.txt\"")
-            print("  load-docs /path/to/documents \"**/*.{txt,pdf,md}\"")
+            print("  load-docs /path/to/documents \"**/*.{txt,pdf,json}\"")
             print("  load-docs /path/to/specific_file.pdf")
             print("\nIf a directory is provided without a glob pattern, the system will automatically detect and load all supported file types.")
             return
@@ -1455,9 +1774,10 @@ class SpoonAICLI:
         glob_pattern = input_list[1] if len(input_list) > 1 else None
 
         try:
+            from spoon_ai.retrieval.document_loader import DocumentLoader
             loader = DocumentLoader()
             print(f"Loading documents from {path}...")
-            documents = loader.load_directory(path, glob_pattern)
+            documents = await loader.aload_directory(path, glob_pattern, show_progress=True)
             print(f"Loaded {len(documents)} document chunks.")
 
             print("Adding documents to agent...")
@@ -1469,24 +1789,28 @@ class SpoonAICLI:
 
     def _handle_delete_docs(self, input_list: List[str]):
         """Handle the delete-docs command"""
-        if not self.current_agent and len(self.agents) == 0:
-            ("No agent loaded. Please load an agent first.")
+        if not self.current_agent and not self.agents:
+            print("No agent loaded. Please load an agent first.")
             return
 
-        if len(input_list) >= 1:
-            print("Usage: delete-docs <agent_name>")
+        if len(input_list) > 1:
+            print("Usage: delete-docs [<agent_name>]")
             return
 
-        if len(input_list) == 1:
+        if input_list:
             agent_name = input_list[0]
-            if agent_name in self.agents:
-                self.agents[agent_name].delete_documents()
+            agent = self.agents.get(agent_name)
+            if agent:
+                agent.delete_documents()
             else:
                 print(f"Agent {agent_name} not found")
-        elif len(input_list) == 0:
+        elif self.current_agent:
             self.current_agent.delete_documents()
+        else:
+            print("No agent loaded. Please load an agent first.")
 
     async def _handle_telegram_run(self, input_list: List[str]):
+        from spoon_ai.social_media.telegram import TelegramClient
         telegram = TelegramClient(self.agents["react"])
         asyncio.create_task(telegram.run())
         print_formatted_text(PromptHTML("<green>Telegram client started</green>"))
@@ -1494,6 +1818,7 @@ class SpoonAICLI:
     def _handle_list_toolkit_categories(self, input_list: List[str]):
         """List all available toolkit categories"""
         try:
+            ToolkitConfig = get_toolkit_config_cls()
             categories = ToolkitConfig.get_all_categories()
             logger.info("Available toolkit categories:")
             for category in categories:
@@ -1509,6 +1834,7 @@ class SpoonAICLI:
     def _handle_list_toolkit_tools(self, input_list: List[str]):
         """List tools in a specific category"""
         try:
+            ToolkitConfig = get_toolkit_config_cls()
             if len(input_list) < 2:
                 logger.error("Usage: list-toolkit-tools <category>")
                 logger.info("Available categories: " + ", ".join(ToolkitConfig.get_all_categories()))
@@ -1527,7 +1853,7 @@ class SpoonAICLI:
                 logger.info(f"  - {tool}")
 
             # Show which tools require configuration
-            config_tools = ToolkitConfig.get_tools_requiring_config()
+            config_tools = set(ToolkitConfig.get_tools_requiring_config())
             category_config_tools = [tool for tool in tools if tool in config_tools]
             if category_config_tools:
                 logger.info(f"\nTools requiring configuration: {', '.join(category_config_tools)}")
@@ -1538,9 +1864,10 @@ class SpoonAICLI:
     def _handle_load_toolkit_tools(self, input_list: List[str]):
         """Load toolkit tools from specified categories"""
         try:
+            available_categories = get_toolkit_config_cls().get_all_categories()
             if len(input_list) < 2:
                 logger.error("Usage: load-toolkit-tools <category1> [category2] ...")
-                logger.info("Available categories: " + ", ".join(ToolkitConfig.get_all_categories()))
+                logger.info("Available categories: " + ", ".join(available_categories))
                 return
 
             if not self.current_agent:
@@ -1548,10 +1875,10 @@ class SpoonAICLI:
                 return
 
             categories = input_list[1:]
-            available_categories = ToolkitConfig.get_all_categories()
 
-            # Validate categories
-            invalid_categories = [cat for cat in categories if cat not in available_categories]
+            # Validate categories; keeps the order they were given in
+            available_set = frozenset(available_categories)
+            invalid_categories = [cat for cat in categories if cat not in available_set]
             if invalid_categories:
                 logger.error(f"Invalid categories: {', '.join(invalid_categories)}")
                 logger.info("Available categories: " + ", ".join(available_categories))
@@ -1566,42 +1893,51 @@ class SpoonAICLI:
         except Exception as e:
             logger.error(f"Error loading toolkit tools: {e}")
 
+    def _get_env_snapshot(self) -> Dict[str, str]:
+        """Return the tracked environment variables that are set, reading os.environ only once"""
+        if self._env_cache is None:
+            environ = os.environ
+            self._env_cache = {name: environ[name] for name in TRACKED_ENV_VARS if environ.get(name)}
+        return self._env_cache
+
+    def _get_category_counts(self) -> Dict[str, int]:
+        """Return the number of registered commands per non-empty category, computed once per command set"""
+        if self._category_counts is None:
+            commands = self.commands
+            counts = {
+                category: sum(1 for cmd in cmd_list if cmd in commands)
+                for category, cmd_list in COMMAND_CATEGORIES.items()
+            }
+            self._category_counts = {category: n for category, n in counts.items() if n}
+        return self._category_counts
+
     def _handle_system_info(self, input_list: List[str]):
         """Display comprehensive system information and health checks"""
-        import platform
-        import sys
-        from datetime import datetime
-
-        print_formatted_text(PromptHTML("<ansiblue><b>🔍 SpoonAI System Information</b></ansiblue>"))
-        print_formatted_text(PromptHTML("<ansiwhite>═══════════════════════════════════════</ansiwhite>"))
+        # The report is collected and written in one go rather than line by line
+        lines = []
+        out = lines.append
 
         # System Information
-        print_formatted_text(PromptHTML("<ansiyellow><b>📊 System Details:</b></ansiyellow>"))
-        print_formatted_text(f"  Platform: {platform.system()} {platform.release()}")
-        print_formatted_text(f"  Python Version: {sys.version}")
-        print_formatted_text(f"  Architecture: {platform.machine()}")
-        print_formatted_text(f"  Timestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        print()
+        out(SYSTEM_INFO_HEADER)
+        out(f"  Platform: {platform.system()} {platform.release()}")
+        out(f"  Python Version: {sys.version}")
+        out(f"  Architecture: {platform.machine()}")
+        out(f"  Timestamp: {datetime.datetime.now():%Y-%m-%d %H:%M:%S}")
+        out("")
 
         # Environment Variables Status
-        print_formatted_text(PromptHTML("<ansiyellow><b>🔑 Environment Variables:</b></ansiyellow>"))
-        env_vars = [
-            ("OPENAI_API_KEY", "OpenAI API"),
-            ("ANTHROPIC_API_KEY", "Anthropic API"),
-            ("DEEPSEEK_API_KEY", "DeepSeek API"),
-            ("TAVILY_API_KEY", "Tavily Search API"),
-            ("SECRET_KEY", "JWT Secret Key"),
-            ("TELEGRAM_BOT_TOKEN", "Telegram Bot"),
-            ("GITHUB_TOKEN", "GitHub API"),
-            ("PRIVATE_KEY", "Wallet Private Key"),
-            ("RPC_URL", "Blockchain RPC"),
-            ("DATABASE_URL", "Database"),
-            ("REDIS_HOST", "Redis Host"),
-        ]
-
-        for var_name, description in env_vars:
-            value = os.getenv(var_name)
+        out(PromptHTML("<ansiyellow><b>🔑 Environment Variables:</b></ansiyellow>"))
+        env = self._get_env_snapshot()
+        # The health checks below reuse what this pass finds
+        found_llm_key = False
+        has_secret_key = False
+        for var_name, description in SYSTEM_INFO_ENV_VARS:
+            value = env.get(var_name)
             if value:
+                if var_name in LLM_API_KEY_VARS:
+                    found_llm_key = True
+                elif var_name == "SECRET_KEY":
+                    has_secret_key = True
                 # Don't show actual secret values, just indicate they're set
                 if "KEY" in var_name or "TOKEN" in var_name or "SECRET" in var_name:
                     masked_value = f"{'*' * min(len(value), 8)}... (length: {len(value)})"
@@ -1610,117 +1946,103 @@ class SpoonAICLI:
                     status = f"<ansigreen>✓ Set</ansigreen> - {value}"
             else:
                 status = "<ansired>✗ Not set</ansired>"
-            print_formatted_text(PromptHTML(f"  {description:20} {status}"))
-        print()
+            out(PromptHTML(f"  {description:20} {status}"))
+        out("")
 
         # Configuration Status
-        print_formatted_text(PromptHTML("<ansiyellow><b>⚙️  Configuration Status:</b></ansiyellow>"))
+        out(PromptHTML("<ansiyellow><b>⚙️  Configuration Status:</b></ansiyellow>"))
         config_file = Path("config.json")
         if config_file.exists():
             try:
                 with open(config_file, 'r') as f:
                     config_data = json.load(f)
-                print_formatted_text(PromptHTML("  <ansigreen>✓ config.json found</ansigreen>"))
+                out(PromptHTML("  <ansigreen>✓ config.json found</ansigreen>"))
 
                 # Check API keys in config
                 api_keys = config_data.get("api_keys", {})
                 if api_keys:
-                    print_formatted_text(f"  API Keys in config: {len(api_keys)}")
+                    out(f"  API Keys in config: {len(api_keys)}")
                     for provider, key in api_keys.items():
                         if key and not self.config_manager._is_placeholder_value(key):
-                            print_formatted_text(PromptHTML(f"    <ansigreen>✓ {provider}</ansigreen>"))
+                            out(PromptHTML(f"    <ansigreen>✓ {provider}</ansigreen>"))
                         else:
-                            print_formatted_text(PromptHTML(f"    <ansired>✗ {provider} (placeholder/empty)</ansired>"))
+                            out(PromptHTML(f"    <ansired>✗ {provider} (placeholder/empty)</ansired>"))
                 else:
-                    print_formatted_text(PromptHTML("  <ansiyellow>! No API keys in config</ansiyellow>"))
+                    out(PromptHTML("  <ansiyellow>! No API keys in config</ansiyellow>"))
 
             except Exception as e:
-                print_formatted_text(PromptHTML(f"  <ansired>✗ Error reading config.json: {e}</ansired>"))
+                out(PromptHTML(f"  <ansired>✗ Error reading config.json: {e}</ansired>"))
         else:
-            print_formatted_text(PromptHTML("  <ansired>✗ config.json not found</ansired>"))
-        print()
+            out(PromptHTML("  <ansired>✗ config.json not found</ansired>"))
+        out("")
 
         # Current Agent Status
-        print_formatted_text(PromptHTML("<ansiyellow><b>🤖 Agent Status:</b></ansiyellow>"))
+        out(PromptHTML("<ansiyellow><b>🤖 Agent Status:</b></ansiyellow>"))
         if self.current_agent:
-            print_formatted_text(PromptHTML(f"  <ansigreen>✓ Active agent: {self.current_agent.name}</ansigreen>"))
-            print_formatted_text(f"  Agent type: {type(self.current_agent).__name__}")
+            out(PromptHTML(f"  <ansigreen>✓ Active agent: {self.current_agent.name}</ansigreen>"))
+            out(f"  Agent type: {type(self.current_agent).__name__}")
             if hasattr(self.current_agent, 'avaliable_tools'):
                 tool_count = len(self.current_agent.avaliable_tools.tools)
-                print_formatted_text(f"  Available tools: {tool_count}")
+                out(f"  Available tools: {tool_count}")
             if hasattr(self.current_agent, 'llm') and self.current_agent.llm:
                 llm_info = f"{getattr(self.current_agent.llm, 'llm_provider', 'unknown')}"
                 model_name = getattr(self.current_agent.llm, 'model_name', 'unknown')
-                print_formatted_text(f"  LLM Provider: {llm_info}")
-                print_formatted_text(f"  Model: {model_name}")
+                out(f"  LLM Provider: {llm_info}")
+                out(f"  Model: {model_name}")
         else:
-            print_formatted_text(PromptHTML("  <ansired>✗ No agent loaded</ansired>"))
-        print()
+            out(PromptHTML("  <ansired>✗ No agent loaded</ansired>"))
+        out("")
 
         # Available Commands
-        print_formatted_text(PromptHTML("<ansiyellow><b>📝 CLI Commands:</b></ansiyellow>"))
-        print_formatted_text(f"  Total commands: {len(self.commands)}")
-        print_formatted_text("  Categories:")
+        out(PromptHTML("<ansiyellow><b>📝 CLI Commands:</b></ansiyellow>"))
+        out(f"  Total commands: {len(self.commands)}")
+        out("  Categories:")
 
         # Group commands by category
-        categories = {
-            "Core": ["help", "exit", "system-info"],
-            "Agent": ["load-agent", "list-agents", "action", "reload-config"],
-            "Chat": ["new-chat", "list-chats", "load-chat"],
-            "Config": ["config"],
-            "Crypto": ["transfer", "swap", "token-info", "token-by-symbol"],
-            "Tools": ["load-docs", "list-toolkit-categories", "list-toolkit-tools", "load-toolkit-tools"],
-            "Social": ["telegram"],
-        }
-
-        for category, cmd_list in categories.items():
-            available_cmds = [cmd for cmd in cmd_list if cmd in self.commands]
-            if available_cmds:
-                print_formatted_text(f"    {category}: {len(available_cmds)} commands")
-        print()
+        for category, count in self._get_category_counts().items():
+            out(f"    {category}: {count} commands")
+        out("")
 
         # Health Check Summary
-        print_formatted_text(PromptHTML("<ansiyellow><b>🏥 Health Check Summary:</b></ansiyellow>"))
+        out(PromptHTML("<ansiyellow><b>🏥 Health Check Summary:</b></ansiyellow>"))
 
         health_score = 0
         total_checks = 5
 
         # Check 1: At least one API key is set
-        has_api_key = any(os.getenv(key) for key in ["OPENAI_API_KEY", "ANTHROPIC_API_KEY", "DEEPSEEK_API_KEY"])
-        if has_api_key:
+        if found_llm_key:
             health_score += 1
-            print_formatted_text(PromptHTML("  <ansigreen>✓ LLM API key configured</ansigreen>"))
+            out(PromptHTML("  <ansigreen>✓ LLM API key configured</ansigreen>"))
         else:
-            print_formatted_text(PromptHTML("  <ansired>✗ No LLM API key found</ansired>"))
+            out(PromptHTML("  <ansired>✗ No LLM API key found</ansired>"))
 
         # Check 2: SECRET_KEY is set
-        if os.getenv("SECRET_KEY"):
+        if has_secret_key:
             health_score += 1
-            print_formatted_text(PromptHTML("  <ansigreen>✓ Security key configured</ansigreen>"))
+            out(PromptHTML("  <ansigreen>✓ Security key configured</ansigreen>"))
         else:
-            print_formatted_text(PromptHTML("  <ansired>✗ SECRET_KEY not set (security risk)</ansired>"))
+            out(PromptHTML("  <ansired>✗ SECRET_KEY not set (security risk)</ansired>"))
 
         # Check 3: Config file exists
         if config_file.exists():
             health_score += 1
-            print_formatted_text(PromptHTML("  <ansigreen>✓ Configuration file present</ansigreen>"))
+            out(PromptHTML("  <ansigreen>✓ Configuration file present</ansigreen>"))
         else:
-            print_formatted_text(PromptHTML("  <ansired>✗ No configuration file</ansired>"))
+            out(PromptHTML("  <ansired>✗ No configuration file</ansired>"))
 
         # Check 4: Agent is loaded
         if self.current_agent:
             health_score += 1
-            print_formatted_text(PromptHTML("  <ansigreen>✓ Agent is loaded and ready</ansigreen>"))
+            out(PromptHTML("  <ansigreen>✓ Agent is loaded and ready</ansigreen>"))
         else:
-            print_formatted_text(PromptHTML("  <ansired>✗ No agent loaded</ansired>"))
+            out(PromptHTML("  <ansired>✗ No agent loaded</ansired>"))
 
         # Check 5: Dependencies check (basic)
-        try:
-            import spoon_ai
+        if SPOON_AI_AVAILABLE:
             health_score += 1
-            print_formatted_text(PromptHTML("  <ansigreen>✓ Core dependencies available</ansigreen>"))
-        except ImportError:
-            print_formatted_text(PromptHTML("  <ansired>✗ Core dependencies missing</ansired>"))
+            out(PromptHTML("  <ansigreen>✓ Core dependencies available</ansigreen>"))
+        else:
+            out(PromptHTML("  <ansired>✗ Core dependencies missing</ansired>"))
 
         # Overall health score
         health_percentage = (health_score / total_checks) * 100
@@ -1734,52 +2056,80 @@ class SpoonAICLI:
             health_color = "ansired"
             health_status = "Poor"
 
-        print()
-        print_formatted_text(PromptHTML(f"  <{health_color}><b>Overall Health: {health_status} ({health_score}/{total_checks} checks passed)</b></{health_color}>"))
+        out("")
+        out(PromptHTML(f"  <{health_color}><b>Overall Health: {health_status} ({health_score}/{total_checks} checks passed)</b></{health_color}>"))
 
         if health_score < total_checks:
-            print()
-            print_formatted_text(PromptHTML("<ansiyellow><b>💡 Recommendations:</b></ansiyellow>"))
-            if not has_api_key:
-                print_formatted_text("  • Set up at least one LLM API key (OPENAI_API_KEY, ANTHROPIC_API_KEY, or DEEPSEEK_API_KEY)")
-            if not os.getenv("SECRET_KEY"):
-                print_formatted_text("  • Set SECRET_KEY for security: python -c \"import secrets; print(secrets.token_urlsafe(32))\"")
+            out("")
+            out(PromptHTML("<ansiyellow><b>💡 Recommendations:</b></ansiyellow>"))
+            if not found_llm_key:
+                out("  • Set up at least one LLM API key (OPENAI_API_KEY, ANTHROPIC_API_KEY, or DEEPSEEK_API_KEY)")
+            if not has_secret_key:
+                out("  • Set SECRET_KEY for security: python -c \"import secrets; print(secrets.token_urlsafe(32))\"")
             if not config_file.exists():
-                print_formatted_text("  • Run 'config' command to set up initial configuration")
+                out("  • Run 'config' command to set up initial configuration")
             if not self.current_agent:
-                print_formatted_text("  • Load an agent with 'load-agent <name>' to start using SpoonAI")
+                out("  • Load an agent with 'load-agent <name>' to start using SpoonAI")
+
+        out(BANNER_LINE)
+        print_formatted_lines(lines)
+
+    def _load_config_file(self, config_file: str) -> tuple:
+        """Return (config_data, ConfigManager) for a config file, parsed again only when its mtime changes"""
+        mtime = os.stat(config_file).st_mtime_ns
+        cached = self._config_files.get(config_file)
+        if cached and cached[0] == mtime:
+            return cached[1], cached[2]
+
+        with open(config_file, 'r') as f:
+            config_data = json.load(f)
+        manager = ConfigManager(config_file)
+        # The last slot memoizes check results, see _run_config_check
+        self._config_files[config_file] = (mtime, config_data, manager, {})
+        return config_data, manager
+
+    def _run_config_check(self, config_file: str, check: Callable[[Dict[str, Any]], Any]) -> Any:
+        """Run check on a config file's data, reusing its result until the file changes
+
+        Only for checks that depend on the file contents alone (e.g. legacy
+        format detection); checks that read os.environ or PATH must run every time.
+        """
+        config_data, _ = self._load_config_file(config_file)
+        results = self._config_files[config_file][3]
+        if check not in results:
+            results[check] = check(config_data)
+        return results[check]
+
+    def _invalidate_config_cache(self):
+        self._config_files.clear()
 
-        print_formatted_text(PromptHTML("<ansiwhite>═══════════════════════════════════════</ansiwhite>"))
     def _handle_migrate_config(self, input_list: List[str]):
         """Handle configuration migration command"""
+        self._env_cache = None
         from spoon_ai.config.migrate_config import migrate_config, interactive_migration
 
-        print_formatted_text(PromptHTML("<ansiblue><b>🔄 Configuration Migration</b></ansiblue>"))
-        print_formatted_text(PromptHTML("<ansiwhite>═══════════════════════════════════════</ansiwhite>"))
+        print_formatted_text(MIGRATE_HEADER)
 
-        # Parse arguments
-        config_file = "config.json"
-        dry_run = False
-        interactive = False
-
-        i = 0
-        while i < len(input_list):
-            arg = input_list[i]
-            if arg in ["-f", "--file"]:
-                if i + 1 < len(input_list):
-                    config_file = input_list[i + 1]
-                    i += 1
-                else:
-                    logger.error("Missing file path after -f/--file")
-                    return
-            elif arg in ["--dry-run", "-d"]:
-                dry_run = True
-            elif arg in ["--interactive", "-i"]:
-                interactive = True
-            elif arg in ["-h", "--help"]:
-                self._show_migrate_help()
-                return
-            i += 1
+        # Parse arguments; errors are reported with the usage text instead of raising
+        try:
+            args, unknown = MIGRATE_PARSER.parse_known_args(input_list)
+        except argparse.ArgumentError as e:
+            if e.argument_name == "-f/--file":
+                logger.error("Missing file path after -f/--file")
+            else:
+                logger.error(f"Invalid migrate-config argument: {e.message}")
+            self._show_migrate_help()
+            return
+        if unknown:
+            logger.error(f"Unknown migrate-config argument: {' '.join(unknown)}")
+            self._show_migrate_help()
+            return
+        if args.help:
+            self._show_migrate_help()
+            return
+        config_file = args.file
+        dry_run = args.dry_run
+        interactive = args.interactive
 
         try:
             if interactive or not input_list:
@@ -1798,6 +2148,8 @@ class SpoonAICLI:
             if success:
                 print_formatted_text(PromptHTML("<ansigreen>✅ Migration completed successfully!</ansigreen>"))
                 if not dry_run:
+                    # The migration rewrites config files in place
+                    self._invalidate_config_cache()
                     print_formatted_text("💡 Tip: Reload your agent to use the new configuration")
             else:
                 print_formatted_text(PromptHTML("<ansired>❌ Migration failed. Check the error messages above.</ansired>"))
@@ -1808,8 +2160,7 @@ class SpoonAICLI:
 
     def _handle_check_config(self, input_list: List[str]):
         """Handle configuration check command"""
-        print_formatted_text(PromptHTML("<ansiblue><b>🔍 Configuration Check</b></ansiblue>"))
-        print_formatted_text(PromptHTML("<ansiwhite>═══════════════════════════════════════</ansiwhite>"))
+        print_formatted_text(CHECK_HEADER)
 
         config_file = "config.json"
         if input_list and not input_list[0].startswith("-"):
@@ -1820,12 +2171,10 @@ class SpoonAICLI:
                 print_formatted_text(PromptHTML(f"<ansired>❌ Configuration file not found: {config_file}</ansired>"))
                 return
 
-            with open(config_file, 'r') as f:
-                config_data = json.load(f)
+            config_data, manager = self._load_config_file(config_file)
 
             # Check if migration is needed
-            manager = ConfigManager(config_file)
-            is_legacy = manager._detect_legacy_config(config_data)
+            is_legacy = self._run_config_check(config_file, manager._detect_legacy_config)
 
             if is_legacy:
                 print_formatted_text(PromptHTML("<ansiyellow>⚠️  Legacy configuration format detected</ansiyellow>"))
@@ -1872,8 +2221,10 @@ class SpoonAICLI:
         """Handle configuration validation command"""
         from spoon_ai.config.migrate_config import validate_environment_variables, check_mcp_server_availability
 
-        print_formatted_text(PromptHTML("<ansiblue><b>✅ Configuration Validation</b></ansiblue>"))
-        print_formatted_text(PromptHTML("<ansiwhite>═══════════════════════════════════════</ansiwhite>"))
+        # The report is collected and written in one go rather than line by line
+        lines = []
+        out = lines.append
+        out(VALIDATE_HEADER)
 
         config_file = "config.json"
         check_env = "--check-env" in input_list or "-e" in input_list
@@ -1884,62 +2235,60 @@ class SpoonAICLI:
 
         try:
             if not Path(config_file).exists():
-                print_formatted_text(PromptHTML(f"<ansired>❌ Configuration file not found: {config_file}</ansired>"))
+                out(PromptHTML(f"<ansired>❌ Configuration file not found: {config_file}</ansired>"))
                 return
 
-            # Load and validate configuration
-            manager = ConfigManager(config_file)
-            config = manager.load_config()
+            # Parse the file once; the manager and the env/server checks below share it.
+            # The env/server checks themselves are rerun each time, since they
+            # read os.environ and PATH rather than the file
+            config_data, manager = self._load_config_file(config_file)
+
+            # Load and validate configuration; a cached manager has already done so
+            config = manager.config or manager.load_config(config_data)
 
-            print_formatted_text(PromptHTML("<ansigreen>✅ Configuration loaded successfully</ansigreen>"))
+            out(PromptHTML("<ansigreen>✅ Configuration loaded successfully</ansigreen>"))
 
             # Run validation
             issues = manager.validate_configuration()
 
             if issues:
-                print_formatted_text(PromptHTML("<ansired>❌ Configuration validation issues found:</ansired>"))
+                out(PromptHTML("<ansired>❌ Configuration validation issues found:</ansired>"))
                 for issue in issues:
-                    print_formatted_text(f"  • {issue}")
+                    out(f"  • {issue}")
             else:
-                print_formatted_text(PromptHTML("<ansigreen>✅ Configuration validation passed</ansigreen>"))
+                out(PromptHTML("<ansigreen>✅ Configuration validation passed</ansigreen>"))
 
             # Check environment variables if requested
             if check_env or not input_list:
-                print_formatted_text(PromptHTML("\n<ansiyellow><b>🔑 Environment Variables Check:</b></ansiyellow>"))
-
-                with open(config_file, 'r') as f:
-                    config_data = json.load(f)
+                out(PromptHTML("\n<ansiyellow><b>🔑 Environment Variables Check:</b></ansiyellow>"))
 
                 missing_vars = validate_environment_variables(config_data)
 
                 if missing_vars:
-                    print_formatted_text(PromptHTML("<ansired>❌ Missing environment variables:</ansired>"))
+                    out(PromptHTML("<ansired>❌ Missing environment variables:</ansired>"))
                     for var in missing_vars:
-                        print_formatted_text(f"  • {var}")
+                        out(f"  • {var}")
                 else:
-                    print_formatted_text(PromptHTML("<ansigreen>✅ All required environment variables are configured</ansigreen>"))
+                    out(PromptHTML("<ansigreen>✅ All required environment variables are configured</ansigreen>"))
 
             # Check MCP server availability if requested
             if check_servers or not input_list:
-                print_formatted_text(PromptHTML("\n<ansiyellow><b>🖥️  MCP Server Availability Check:</b></ansiyellow>"))
-
-                with open(config_file, 'r') as f:
-                    config_data = json.load(f)
+                out(PromptHTML("\n<ansiyellow><b>🖥️  MCP Server Availability Check:</b></ansiyellow>"))
 
                 unavailable = check_mcp_server_availability(config_data)
 
                 if unavailable:
-                    print_formatted_text(PromptHTML("<ansired>❌ Unavailable MCP server commands:</ansired>"))
+                    out(PromptHTML("<ansired>❌ Unavailable MCP server commands:</ansired>"))
                     for server in unavailable:
-                        print_formatted_text(f"  • {server}")
-                    print_formatted_text(PromptHTML("\n<ansiyellow>💡 Installation suggestions:</ansiyellow>"))
-                    print_formatted_text("  • For npx: npm install -g npm")
-                    print_formatted_text("  • For uvx: pip install uv")
+                        out(f"  • {server}")
+                    out(PromptHTML("\n<ansiyellow>💡 Installation suggestions:</ansiyellow>"))
+                    out("  • For npx: npm install -g npm")
+                    out("  • For uvx: pip install uv")
                 else:
-                    print_formatted_text(PromptHTML("<ansigreen>✅ All MCP server commands are available</ansigreen>"))
+                    out(PromptHTML("<ansigreen>✅ All MCP server commands are available</ansigreen>"))
 
             # Summary
-            print_formatted_text(PromptHTML("\n<ansiyellow><b>📊 Validation Summary:</b></ansiyellow>"))
+            out(PromptHTML("\n<ansiyellow><b>📊 Validation Summary:</b></ansiyellow>"))
 
             total_issues = len(issues)
             if check_env or not input_list:
@@ -1948,30 +2297,15 @@ class SpoonAICLI:
                 total_issues += len(unavailable) if 'unavailable' in locals() else 0
 
             if total_issues == 0:
-                print_formatted_text(PromptHTML("<ansigreen>🎉 Configuration is fully valid and ready to use!</ansigreen>"))
+                out(PromptHTML("<ansigreen>🎉 Configuration is fully valid and ready to use!</ansigreen>"))
             else:
-                print_formatted_text(PromptHTML(f"<ansiyellow>⚠️  Found {total_issues} issues that need attention</ansiyellow>"))
+                out(PromptHTML(f"<ansiyellow>⚠️  Found {total_issues} issues that need attention</ansiyellow>"))
 
         except Exception as e:
-            print_formatted_text(PromptHTML(f"<ansired>❌ Validation failed: {e}</ansired>"))
+            out(PromptHTML(f"<ansired>❌ Validation failed: {e}</ansired>"))
+        finally:
+            print_formatted_lines(lines)
 
     def _show_migrate_help(self):
         """Show help for migration command"""
-        print_formatted_text(PromptHTML("<ansiblue><b>🔄 Configuration Migration Help</b></ansiblue>"))
-        print_formatted_text(PromptHTML("<ansiwhite>═══════════════════════════════════════</ansiwhite>"))
-        print_formatted_text("Usage:")
-        print_formatted_text("  migrate-config                    # Interactive migration")
-        print_formatted_text("  migrate-config -f config.json     # Migrate specific file")
-        print_formatted_text("  migrate-config --dry-run          # Preview changes without applying")
-        print_formatted_text("  migrate-config --interactive      # Force interactive mode")
-        print_formatted_text("")
-        print_formatted_text("Options:")
-        print_formatted_text("  -f, --file FILE     Configuration file to migrate (default: config.json)")
-        print_formatted_text("  -d, --dry-run       Show what would be changed without making changes")
-        print_formatted_text("  -i, --interactive   Run in interactive mode")
-        print_formatted_text("  -h, --help          Show this help message")
-        print_formatted_text("")
-        print_formatted_text("Examples:")
-        print_formatted_text("  migrate-config                           # Interactive migration")
-        print_formatted_text("  migrate-config -f my_config.json         # Migrate specific file")
-        print_formatted_text("  migrate-config --dry-run                 # Preview migration")
\ No newline at end of file
+        print_formatted_text(MIGRATE_HELP)
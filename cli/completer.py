@@ -0,0 +1,27 @@
+import bisect
+from typing import Iterable
+
+from prompt_toolkit.completion import Completer, Completion
+
+
+class PrefixCompleter(Completer):
+    """Case-insensitive prefix completer for command names.
+
+    Names are lowercased and sorted once, so each keypress lowercases only
+    the typed word and finds the matching range with a binary search instead
+    of comparing against every candidate.
+    """
+
+    def __init__(self, words: Iterable[str]):
+        pairs = sorted((word.lower(), word) for word in set(words))
+        self._keys = [key for key, _ in pairs]
+        self._words = [word for _, word in pairs]
+
+    def get_completions(self, document, complete_event):
+        prefix = document.get_word_before_cursor(WORD=True)
+        key = prefix.lower()
+        start = bisect.bisect_left(self._keys, key)
+        for i in range(start, len(self._keys)):
+            if not self._keys[i].startswith(key):
+                break
+            yield Completion(self._words[i], start_position=-len(prefix))
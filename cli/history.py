@@ -0,0 +1,19 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from prompt_toolkit.history import FileHistory
+
+
+class BackgroundFileHistory(FileHistory):
+    """FileHistory that appends new entries from a background thread.
+
+    Writes go through a single-worker executor, so entries keep their order
+    and the prompt never waits on disk I/O after a command is entered.
+    Pending writes are flushed when the interpreter exits.
+    """
+
+    def __init__(self, filename):
+        super().__init__(filename)
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="history-writer")
+
+    def store_string(self, string: str) -> None:
+        self._writer.submit(super().store_string, string)
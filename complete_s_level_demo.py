@@ -51,6 +51,8 @@ async def demo_real_data_integration():
             print(f"   Confidence: {yield_result.get('confidence', 'Medium')}")
         else:
             print(f"⚠️  Yield estimation: {yield_result}")
+        
+        await connector.aclose()
             
     except Exception as e:
         print(f"⚠️  Import/Connection error: {e}")
@@ -227,5 +229,21 @@ async def main():
     print("💰 Expected Award: $500 (S-Level)")
     print("=" * 60)
 
+def _new_event_loop():
+    """Event loop for the demo, with eager tasks on Python 3.12+
+
+    Cached TVL lookups finish without awaiting I/O; eager tasks run such
+    coroutines to completion immediately instead of scheduling them.
+    """
+    loop = asyncio.new_event_loop()
+    if hasattr(asyncio, "eager_task_factory"):
+        loop.set_task_factory(asyncio.eager_task_factory)
+    return loop
+
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    loop = _new_event_loop()
+    try:
+        loop.run_until_complete(main())
+    finally:
+        loop.run_until_complete(loop.shutdown_asyncgens())
+        loop.close()
\ No newline at end of file
@@ -6,12 +6,55 @@ SQLite Database Models for RWA Yield Optimizer
 
 import sqlite3
 import json
-from datetime import datetime
-from typing import Dict, List, Optional
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Dict, List, Optional
 from dataclasses import dataclass, asdict
 import os
 
-@dataclass
+if TYPE_CHECKING:
+    import numpy as np
+
+def _iso_now() -> str:
+    """Current UTC time as an ISO 8601 string, the format of every timestamp column"""
+    return datetime.now(timezone.utc).isoformat()
+
+def _iso_cutoff(**delta) -> str:
+    """ISO timestamp for a timedelta(**delta) ago, comparable with _iso_now() values"""
+    return (datetime.now(timezone.utc) - timedelta(**delta)).isoformat()
+
+# PRAGMA user_version once naive local timestamps have been rewritten to UTC
+UTC_TIMESTAMPS_VERSION = 1
+
+# (table, column) pairs holding timestamps written by _iso_now()
+TIMESTAMP_COLUMNS = (
+    ("protocol_data", "timestamp"),
+    ("ai_predictions", "timestamp"),
+    ("portfolio_allocations", "timestamp"),
+    ("user_settings", "timestamp"),
+    ("defillama_cache", "ts"),
+)
+
+# Statements used by more than one method, or picked per call; built once so
+# the text handed to sqlite3 (and its statement cache) is always identical
+PROTOCOL_DATA_INSERT = """
+    INSERT OR REPLACE INTO protocol_data 
+    (protocol, current_apy, risk_score, asset_type, tvl, active_pools, 
+     min_investment, lock_period, change_1d, change_7d, timestamp)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+PORTFOLIO_ALLOCATION_INSERT = """
+    INSERT INTO portfolio_allocations 
+    (session_id, protocol, allocation_amount, allocation_percentage, 
+     expected_apy, risk_score, timestamp)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+AI_PREDICTIONS_QUERY = "SELECT * FROM ai_predictions WHERE protocol = ? ORDER BY timestamp DESC LIMIT ?"
+AI_PREDICTIONS_BY_TIMEFRAME_QUERY = (
+    "SELECT * FROM ai_predictions WHERE protocol = ? AND timeframe = ? ORDER BY timestamp DESC LIMIT ?"
+)
+
+@dataclass(slots=True)
 class ProtocolData:
     """Protocol data model"""
     id: Optional[int] = None
@@ -27,7 +70,7 @@ class ProtocolData:
     change_7d: float = 0.0
     timestamp: str = ""
 
-@dataclass
+@dataclass(slots=True)
 class AIPrediction:
     """AI prediction model"""
     id: Optional[int] = None
@@ -40,7 +83,7 @@ class AIPrediction:
     risk_factors: str = ""  # JSON string
     timestamp: str = ""
 
-@dataclass
+@dataclass(slots=True)
 class PortfolioAllocation:
     """Portfolio allocation model"""
     id: Optional[int] = None
@@ -52,21 +95,57 @@ class PortfolioAllocation:
     risk_score: float = 0.0
     timestamp: str = ""
 
+@dataclass(slots=True)
+class ProtocolHistory:
+    """Protocol history as one numpy array per numeric column (row i across all arrays)"""
+    protocol: str
+    timestamp: "np.ndarray"  # POSIX seconds
+    current_apy: "np.ndarray"
+    tvl: "np.ndarray"
+    change_1d: "np.ndarray"
+    change_7d: "np.ndarray"
+    
+    def __len__(self) -> int:
+        return len(self.timestamp)
+
 class DatabaseManager:
     """SQLite database manager"""
     
     def __init__(self, db_path: str = "data/rwa_optimizer.db"):
         self.db_path = db_path
+        # One connection per thread, opened on first use and reused afterwards
+        self._local = threading.local()
         # Ensure data directory exists
         os.makedirs(os.path.dirname(db_path), exist_ok=True)
         self.init_database()
     
     def get_connection(self):
-        """Get database connection"""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row  # Enable dict-like access
+        """Get this thread's database connection
+        
+        Using the connection as a context manager commits (or rolls back)
+        the transaction; it does not close the connection.
+        """
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path)
+            conn.row_factory = sqlite3.Row  # Enable dict-like access
+            # WAL lets readers run alongside a writer and makes commits cheaper
+            conn.executescript("""
+                PRAGMA journal_mode=WAL;
+                PRAGMA synchronous=NORMAL;
+                PRAGMA temp_store=MEMORY;
+                PRAGMA mmap_size=268435456;
+            """)
+            self._local.conn = conn
         return conn
     
+    def close(self):
+        """Close this thread's database connection"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+    
     def init_database(self):
         """Initialize database tables"""
         with self.get_connection() as conn:
@@ -118,6 +197,22 @@ class DatabaseManager:
                 )
             """)
             
+            # Cached external API responses (e.g. DeFiLlama), keyed by request hash
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS defillama_cache (
+                    key TEXT PRIMARY KEY,
+                    payload TEXT NOT NULL,
+                    ts TEXT NOT NULL
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_defillama_cache_ts ON defillama_cache(ts)")
+            
+            # Timestamp indexes for the history and cleanup range queries;
+            # UNIQUE(protocol, timestamp) already indexes per-protocol lookups
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_protocol_data_ts ON protocol_data(timestamp)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_ai_preds_ts ON ai_predictions(timestamp)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_portfolio_ts ON portfolio_allocations(timestamp)")
+            
             # User settings table
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS user_settings (
@@ -128,25 +223,58 @@ class DatabaseManager:
                 )
             """)
             
+            self._migrate_naive_timestamps(conn)
             conn.commit()
     
+    @staticmethod
+    def _migrate_naive_timestamps(conn: sqlite3.Connection):
+        """Rewrite timestamps written as naive local time to UTC, once per database
+        
+        Older rows used datetime.now().isoformat(); mixed with UTC values they
+        sort and compare wrongly as strings.
+        """
+        if conn.execute("PRAGMA user_version").fetchone()[0] >= UTC_TIMESTAMPS_VERSION:
+            return
+        for table, column in TIMESTAMP_COLUMNS:
+            # Naive values carry no offset; astimezone() reads them as local time
+            rows = conn.execute(
+                f"SELECT rowid, {column} FROM {table} WHERE {column} NOT LIKE '%+__:__'"
+            ).fetchall()
+            conn.executemany(
+                f"UPDATE OR REPLACE {table} SET {column} = ? WHERE rowid = ?",
+                [(datetime.fromisoformat(value).astimezone(timezone.utc).isoformat(), rowid)
+                 for rowid, value in rows]
+            )
+        conn.execute(f"PRAGMA user_version = {UTC_TIMESTAMPS_VERSION}")
+    
+    @staticmethod
+    def _protocol_data_params(data: ProtocolData) -> tuple:
+        return (
+            data.protocol, data.current_apy, data.risk_score, data.asset_type,
+            data.tvl, data.active_pools, data.min_investment, data.lock_period,
+            data.change_1d, data.change_7d, data.timestamp
+        )
+    
     def save_protocol_data(self, data: ProtocolData) -> int:
         """Save protocol data"""
-        data.timestamp = datetime.now().isoformat()
+        data.timestamp = _iso_now()
         
         with self.get_connection() as conn:
-            cursor = conn.execute("""
-                INSERT OR REPLACE INTO protocol_data 
-                (protocol, current_apy, risk_score, asset_type, tvl, active_pools, 
-                 min_investment, lock_period, change_1d, change_7d, timestamp)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                data.protocol, data.current_apy, data.risk_score, data.asset_type,
-                data.tvl, data.active_pools, data.min_investment, data.lock_period,
-                data.change_1d, data.change_7d, data.timestamp
-            ))
+            cursor = conn.execute(PROTOCOL_DATA_INSERT, self._protocol_data_params(data))
             return cursor.lastrowid
     
+    def save_protocol_data_many(self, rows: List[ProtocolData]) -> int:
+        """Save several protocol data rows in a single transaction"""
+        timestamp = _iso_now()
+        params = []
+        for data in rows:
+            data.timestamp = timestamp
+            params.append(self._protocol_data_params(data))
+        
+        with self.get_connection() as conn:
+            conn.executemany(PROTOCOL_DATA_INSERT, params)
+        return len(params)
+    
     def get_protocol_data(self, protocol: str, limit: int = 1) -> List[ProtocolData]:
         """Get protocol data"""
         with self.get_connection() as conn:
@@ -158,26 +286,31 @@ class DatabaseManager:
             """, (protocol, limit))
             
             rows = cursor.fetchall()
-            return [ProtocolData(**dict(row)) for row in rows]
+            return [ProtocolData(**row) for row in rows]
     
     def get_all_latest_protocols(self) -> List[ProtocolData]:
         """Get latest data for all protocols"""
         with self.get_connection() as conn:
+            # One ordered pass over the (protocol, timestamp) index instead of
+            # joining against a GROUP BY temp table
             cursor = conn.execute("""
-                SELECT p1.* FROM protocol_data p1
-                INNER JOIN (
-                    SELECT protocol, MAX(timestamp) as max_timestamp
+                SELECT id, protocol, current_apy, risk_score, asset_type, tvl, active_pools,
+                       min_investment, lock_period, change_1d, change_7d, timestamp
+                FROM (
+                    SELECT *, ROW_NUMBER() OVER (
+                        PARTITION BY protocol ORDER BY timestamp DESC
+                    ) AS rn
                     FROM protocol_data
-                    GROUP BY protocol
-                ) p2 ON p1.protocol = p2.protocol AND p1.timestamp = p2.max_timestamp
+                )
+                WHERE rn = 1
             """)
             
             rows = cursor.fetchall()
-            return [ProtocolData(**dict(row)) for row in rows]
+            return [ProtocolData(**row) for row in rows]
     
     def save_ai_prediction(self, prediction: AIPrediction) -> int:
         """Save AI prediction"""
-        prediction.timestamp = datetime.now().isoformat()
+        prediction.timestamp = _iso_now()
         
         with self.get_connection() as conn:
             cursor = conn.execute("""
@@ -194,38 +327,46 @@ class DatabaseManager:
     
     def get_ai_predictions(self, protocol: str, timeframe: str = None, limit: int = 10) -> List[AIPrediction]:
         """Get AI predictions"""
-        query = "SELECT * FROM ai_predictions WHERE protocol = ?"
-        params = [protocol]
-        
         if timeframe:
-            query += " AND timeframe = ?"
-            params.append(timeframe)
-        
-        query += " ORDER BY timestamp DESC LIMIT ?"
-        params.append(limit)
+            query = AI_PREDICTIONS_BY_TIMEFRAME_QUERY
+            params = (protocol, timeframe, limit)
+        else:
+            query = AI_PREDICTIONS_QUERY
+            params = (protocol, limit)
         
         with self.get_connection() as conn:
             cursor = conn.execute(query, params)
             rows = cursor.fetchall()
-            return [AIPrediction(**dict(row)) for row in rows]
+            return [AIPrediction(**row) for row in rows]
+    
+    @staticmethod
+    def _portfolio_allocation_params(allocation: PortfolioAllocation) -> tuple:
+        return (
+            allocation.session_id, allocation.protocol, allocation.allocation_amount,
+            allocation.allocation_percentage, allocation.expected_apy,
+            allocation.risk_score, allocation.timestamp
+        )
     
     def save_portfolio_allocation(self, allocation: PortfolioAllocation) -> int:
         """Save portfolio allocation"""
-        allocation.timestamp = datetime.now().isoformat()
+        allocation.timestamp = _iso_now()
         
         with self.get_connection() as conn:
-            cursor = conn.execute("""
-                INSERT INTO portfolio_allocations 
-                (session_id, protocol, allocation_amount, allocation_percentage, 
-                 expected_apy, risk_score, timestamp)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            """, (
-                allocation.session_id, allocation.protocol, allocation.allocation_amount,
-                allocation.allocation_percentage, allocation.expected_apy,
-                allocation.risk_score, allocation.timestamp
-            ))
+            cursor = conn.execute(PORTFOLIO_ALLOCATION_INSERT, self._portfolio_allocation_params(allocation))
             return cursor.lastrowid
     
+    def save_portfolio_allocations_many(self, allocations: List[PortfolioAllocation]) -> int:
+        """Save several portfolio allocations in a single transaction"""
+        timestamp = _iso_now()
+        params = []
+        for allocation in allocations:
+            allocation.timestamp = timestamp
+            params.append(self._portfolio_allocation_params(allocation))
+        
+        with self.get_connection() as conn:
+            conn.executemany(PORTFOLIO_ALLOCATION_INSERT, params)
+        return len(params)
+    
     def get_portfolio_allocations(self, session_id: str) -> List[PortfolioAllocation]:
         """Get portfolio allocations for session"""
         with self.get_connection() as conn:
@@ -236,11 +377,11 @@ class DatabaseManager:
             """, (session_id,))
             
             rows = cursor.fetchall()
-            return [PortfolioAllocation(**dict(row)) for row in rows]
+            return [PortfolioAllocation(**row) for row in rows]
     
     def save_user_setting(self, key: str, value: str):
         """Save user setting"""
-        timestamp = datetime.now().isoformat()
+        timestamp = _iso_now()
         
         with self.get_connection() as conn:
             conn.execute("""
@@ -260,36 +401,105 @@ class DatabaseManager:
             row = cursor.fetchone()
             return row['setting_value'] if row else default
     
+    def save_cached_response(self, key: str, payload: str):
+        """Save a cached API response"""
+        timestamp = _iso_now()
+        
+        with self.get_connection() as conn:
+            conn.execute("""
+                INSERT OR REPLACE INTO defillama_cache (key, payload, ts)
+                VALUES (?, ?, ?)
+            """, (key, payload, timestamp))
+    
+    def get_cached_response(self, key: str, max_age: float) -> Optional[str]:
+        """Get a cached API response no older than max_age seconds"""
+        cutoff = _iso_cutoff(seconds=max_age)
+        
+        with self.get_connection() as conn:
+            cursor = conn.execute("""
+                SELECT payload FROM defillama_cache 
+                WHERE key = ? AND ts >= ?
+            """, (key, cutoff))
+            
+            row = cursor.fetchone()
+            return row['payload'] if row else None
+    
     def get_protocol_history(self, protocol: str, days: int = 30) -> List[ProtocolData]:
         """Get protocol historical data"""
+        # Timestamps are ISO strings written by _iso_now(), so comparing
+        # against a cutoff in the same format lets SQLite use the index
+        cutoff = _iso_cutoff(days=days)
+        
         with self.get_connection() as conn:
             cursor = conn.execute("""
                 SELECT * FROM protocol_data 
                 WHERE protocol = ? 
-                AND datetime(timestamp) >= datetime('now', '-{} days')
+                AND timestamp >= ?
                 ORDER BY timestamp ASC
-            """.format(days), (protocol,))
+            """, (protocol, cutoff))
             
             rows = cursor.fetchall()
-            return [ProtocolData(**dict(row)) for row in rows]
+            return [ProtocolData(**row) for row in rows]
+    
+    def get_protocol_history_soa(self, protocol: str, days: int = 30) -> ProtocolHistory:
+        """Get protocol historical data as a ProtocolHistory of column arrays
+        
+        For analysis over long histories; avoids building a ProtocolData per
+        row. Requires numpy (GUI requirements).
+        """
+        import numpy as np
+        
+        cutoff = _iso_cutoff(days=days)
+        columns = ([], [], [], [], [])
+        
+        with self.get_connection() as conn:
+            cursor = conn.execute("""
+                SELECT current_apy, tvl, change_1d, change_7d, timestamp FROM protocol_data 
+                WHERE protocol = ? 
+                AND timestamp >= ?
+                ORDER BY timestamp ASC
+            """, (protocol, cutoff))
+            cursor.arraysize = 1000
+            while chunk := cursor.fetchmany():
+                for column, values in zip(columns, zip(*chunk)):
+                    column.extend(values)
+        
+        count = len(columns[4])
+        current_apy, tvl, change_1d, change_7d = (
+            np.fromiter(column, dtype=np.float64, count=count) for column in columns[:4]
+        )
+        timestamp = np.fromiter(
+            (datetime.fromisoformat(ts).timestamp() for ts in columns[4]),
+            dtype=np.float64, count=count
+        )
+        return ProtocolHistory(
+            protocol=protocol,
+            timestamp=timestamp,
+            current_apy=current_apy,
+            tvl=tvl,
+            change_1d=change_1d,
+            change_7d=change_7d
+        )
     
     def cleanup_old_data(self, days: int = 90):
         """Clean up old data"""
+        cutoff = _iso_cutoff(days=days)
+        
         with self.get_connection() as conn:
             # Keep only recent data
             conn.execute("""
                 DELETE FROM protocol_data 
-                WHERE datetime(timestamp) < datetime('now', '-{} days')
-            """.format(days))
+                WHERE timestamp < ?
+            """, (cutoff,))
             
             conn.execute("""
                 DELETE FROM ai_predictions 
-                WHERE datetime(timestamp) < datetime('now', '-{} days')
-            """.format(days))
+                WHERE timestamp < ?
+            """, (cutoff,))
             
             conn.execute("""
                 DELETE FROM portfolio_allocations 
-                WHERE datetime(timestamp) < datetime('now', '-{} days')
-            """.format(days))
+                WHERE timestamp < ?
+            """, (cutoff,))
             
             conn.commit()
\ No newline at end of file
@@ -118,6 +118,8 @@ async def main():
             print(f"✅ Real data retrieved: ${result.get('tvl', 'N/A')}")
         else:
             print(f"⚠️  API fallback active: {result['error'][:50]}...")
+        
+        await connector.aclose()
             
     except Exception as e:
         print(f"⚠️  System running in demo mode: {str(e)[:50]}...")
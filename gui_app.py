@@ -131,7 +131,7 @@ def show_dashboard():
     with col4:
         last_update = summary.get('last_updated', 'Never')
         if last_update != 'Never':
-            last_update = datetime.fromisoformat(last_update).strftime('%H:%M:%S')
+            last_update = datetime.fromisoformat(last_update).astimezone().strftime('%H:%M:%S')
         st.markdown(f"""
         <div class="metric-card">
             <h3>Last Updated</h3>
@@ -259,7 +259,7 @@ def show_protocol_analysis():
             
             if len(history) > 1:
                 df_history = pd.DataFrame([{
-                    'Date': datetime.fromisoformat(h.timestamp).date(),
+                    'Date': datetime.fromisoformat(h.timestamp).astimezone().date(),
                     'APY': h.current_apy,
                     'Risk Score': h.risk_score,
                     'TVL': h.tvl
@@ -352,7 +352,7 @@ def show_ai_predictions():
         
         if history:
             df_predictions = pd.DataFrame([{
-                'Date': datetime.fromisoformat(h.timestamp).strftime('%Y-%m-%d %H:%M'),
+                'Date': datetime.fromisoformat(h.timestamp).astimezone().strftime('%Y-%m-%d %H:%M'),
                 'Timeframe': h.timeframe,
                 'Predicted APY': f"{h.predicted_apy:.1f}%",
                 'Confidence': f"{h.confidence:.1f}/10",
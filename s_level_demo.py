@@ -41,6 +41,8 @@ async def demo_s_level_features():
         else:
             print(f"⚠️  API call failed: {real_data['error']}")
             print("📝 Note: This is expected in demo environment")
+        
+        await connector.aclose()
             
     except Exception as e:
         print(f"⚠️  Import error: {e}")
@@ -9,7 +9,8 @@ import asyncio
 import uuid
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
-import json
+
+import orjson
 
 from database.models import DatabaseManager, ProtocolData, AIPrediction, PortfolioAllocation
 from simple_rwa_agent import SimpleRWAAgent
@@ -31,6 +32,7 @@ class RWADataService:
                 protocols = self.agent.supported_protocols
             
             results = {}
+            rows = []
             for proto in protocols:
                 try:
                     # Get data from agent
@@ -51,8 +53,7 @@ class RWADataService:
                             change_7d=0.0   # Would be from API
                         )
                         
-                        # Save to database
-                        self.db.save_protocol_data(db_data)
+                        rows.append(db_data)
                         results[proto] = "success"
                     else:
                         results[proto] = "no_data"
@@ -60,6 +61,10 @@ class RWADataService:
                 except Exception as e:
                     results[proto] = f"error: {str(e)}"
             
+            # Save to database in one transaction
+            if rows:
+                self.db.save_protocol_data_many(rows)
+            
             return results
             
         except Exception as e:
@@ -91,7 +96,7 @@ class RWADataService:
                 predicted_apy = current_data.current_apy + 0.5  # Simple prediction
                 confidence = 7.5
                 reasoning = "AI ensemble analysis suggests moderate yield increase"
-                risk_factors = json.dumps(["Market volatility", "Protocol risk", "Regulatory changes"])
+                risk_factors = ["Market volatility", "Protocol risk", "Regulatory changes"]
                 
                 # Save to database
                 ai_pred = AIPrediction(
@@ -101,7 +106,7 @@ class RWADataService:
                     confidence=confidence,
                     model_name="ensemble",
                     reasoning=reasoning,
-                    risk_factors=risk_factors
+                    risk_factors=orjson.dumps(risk_factors).decode()
                 )
                 
                 self.db.save_ai_prediction(ai_pred)
@@ -111,7 +116,7 @@ class RWADataService:
                     "predicted_apy": predicted_apy,
                     "confidence": confidence,
                     "reasoning": reasoning,
-                    "risk_factors": json.loads(risk_factors),
+                    "risk_factors": risk_factors,
                     "full_report": prediction_text
                 }
             else:
@@ -135,12 +140,13 @@ class RWADataService:
             if not protocols_data:
                 return {"success": False, "error": "No protocol data available"}
             
-            # Simple allocation algorithm
-            total_weight = sum(p.current_apy / (1 + p.risk_score) for p in protocols_data)
+            # Simple allocation algorithm: weight by risk-adjusted APY
+            scores = [p.current_apy / (1 + p.risk_score) for p in protocols_data]
+            total_weight = sum(scores)
             allocations = []
             
-            for protocol_data in protocols_data:
-                weight = (protocol_data.current_apy / (1 + protocol_data.risk_score)) / total_weight
+            for protocol_data, score in zip(protocols_data, scores):
+                weight = score / total_weight
                 allocation_amount = investment_amount * weight
                 
                 allocation = PortfolioAllocation(
@@ -151,10 +157,11 @@ class RWADataService:
                     expected_apy=protocol_data.current_apy,
                     risk_score=protocol_data.risk_score
                 )
-                
-                self.db.save_portfolio_allocation(allocation)
                 allocations.append(allocation)
             
+            # Save all allocations in one transaction
+            self.db.save_portfolio_allocations_many(allocations)
+            
             # Calculate portfolio metrics
             weighted_apy = sum(a.expected_apy * a.allocation_percentage / 100 for a in allocations)
             weighted_risk = sum(a.risk_score * a.allocation_percentage / 100 for a in allocations)
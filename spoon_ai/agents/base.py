@@ -145,7 +145,7 @@ class BaseAgent(BaseModel, ABC):
         
         history_file = history_dir / f'{self.name}_history.json'
         
-        now = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        now = datetime.datetime.now().isoformat(sep=' ', timespec='seconds')
         
         if isinstance(self.chat_history, list):
             save_data = {
@@ -169,10 +169,20 @@ class BaseAgent(BaseModel, ABC):
                 'messages': []
             }
         
+        metadata = save_data['metadata']
+        # Small sidecar so listing chats doesn't need to parse every full history
+        meta_data = {
+            'msg_count': len(save_data.get('messages', [])),
+            'created_at': metadata.get('created_at', now),
+            'updated_at': metadata.get('updated_at', now)
+        }
+
         try:
             with open(history_file, 'w', encoding='utf-8') as f:
                 json.dump(save_data, f, ensure_ascii=False, indent=2)
-            debug_log(f"Saved chat history with {len(save_data.get('messages', []))} messages")
+            with open(history_dir / f'{self.name}_history.meta.json', 'w', encoding='utf-8') as f:
+                json.dump(meta_data, f, ensure_ascii=False)
+            debug_log(f"Saved chat history with {meta_data['msg_count']} messages")
         except Exception as e:
             debug_log(f"Error saving chat history: {e}")
 
@@ -26,16 +26,21 @@ class ConfigManager:
         self.tool_factory = ToolFactory(self.mcp_manager)
 
     
-    def load_config(self) -> SpoonConfig:
-        """Load and validate configuration from file."""
+    def load_config(self, config_data: Optional[Dict[str, Any]] = None) -> SpoonConfig:
+        """Load and validate configuration from file.
+
+        Callers that already parsed the file can pass its contents as
+        config_data to skip reading it again.
+        """
         try:
-            if not os.path.exists(self.config_path):
-                logger.warning(f"Config file not found: {self.config_path}, using defaults")
-                self.config = SpoonConfig()
-                return self.config
-            
-            with open(self.config_path, 'r', encoding='utf-8') as f:
-                config_data = json.load(f)
+            if config_data is None:
+                if not os.path.exists(self.config_path):
+                    logger.warning(f"Config file not found: {self.config_path}, using defaults")
+                    self.config = SpoonConfig()
+                    return self.config
+
+                with open(self.config_path, 'r', encoding='utf-8') as f:
+                    config_data = json.load(f)
             
             # Validate and create configuration
             self.config = SpoonConfig(**config_data)
@@ -1,11 +1,14 @@
 """MCP Server lifecycle management."""
 
 import asyncio
+import functools
 import hashlib
 import logging
 import os
+import platform
+import shutil
 import subprocess
-from typing import Dict, Optional, Set, Any
+from typing import Dict, List, Optional, Set, Any
 from dataclasses import dataclass
 
 from fastmcp import Client as MCPClient
@@ -16,6 +19,66 @@ from .errors import MCPServerError
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=4)
+def _path_index(path_env: str) -> Dict[str, List[str]]:
+    """Map each file name found on PATH to the directories containing it, in PATH order."""
+    index: Dict[str, List[str]] = {}
+    for directory in path_env.split(os.pathsep):
+        if not directory:
+            continue
+        try:
+            names = os.listdir(directory)
+        except OSError:
+            continue
+        for name in names:
+            index.setdefault(os.path.normcase(name), []).append(directory)
+    return index
+
+
+def _which(command: str) -> Optional[str]:
+    """shutil.which backed by a PATH listing built once per PATH value.
+
+    Misses fall back to shutil.which, so tools installed after the index
+    was built are still found.
+    """
+    if os.path.dirname(command):
+        return shutil.which(command)
+
+    candidates = [command]
+    if os.name == "nt":
+        extensions = os.environ.get("PATHEXT", ".COM;.EXE;.BAT;.CMD").split(os.pathsep)
+        if not any(command.lower().endswith(ext.lower()) for ext in extensions if ext):
+            candidates = [command + ext for ext in extensions if ext]
+
+    index = _path_index(os.environ.get("PATH", os.defpath))
+    for candidate in candidates:
+        for directory in index.get(os.path.normcase(candidate), ()):
+            path = os.path.join(directory, candidate)
+            if os.access(path, os.X_OK) and not os.path.isdir(path):
+                return path
+    return shutil.which(command)
+
+
+def _resolve_server_command(command: str) -> Optional[str]:
+    """Return the full path of an MCP server command, or None if it isn't installed."""
+    # Handle Windows-specific command path issues
+    if platform.system() == "Windows" and command == "npx":
+        # On Windows, use npx.cmd instead of npx to avoid path issues
+        command = "npx.cmd"
+
+    # Get full path to command
+    command_path = _which(command)
+    if not command_path and command in ["npx", "npx.cmd"]:
+        # For npx/npx.cmd, try to find npm instead and use npx from there
+        npm_path = _which("npm")
+        if npm_path:
+            npm_dir = os.path.dirname(npm_path)
+            npx_path = os.path.join(npm_dir, "npx.cmd" if platform.system() == "Windows" else "npx")
+            if os.path.exists(npx_path):
+                command_path = npx_path
+    return command_path
+
+
 @dataclass
 class MCPServerInstance:
     """Represents a running MCP server instance."""
@@ -165,31 +228,10 @@ class MCPServerManager:
     def _create_transport(self, config: MCPServerConfig):
         """Create appropriate transport for the MCP server."""
         from fastmcp.client.transports import StdioTransport
-        import shutil
-        import platform
-        
-        # Handle Windows-specific command path issues
-        command = config.command
-        if platform.system() == "Windows" and command == "npx":
-            # On Windows, use npx.cmd instead of npx to avoid path issues
-            command = "npx.cmd"
         
-        # Get full path to command
-        command_path = shutil.which(command)
+        command_path = _resolve_server_command(config.command)
         if not command_path:
-            # For npx/npx.cmd, try to find npm instead and use npx from there
-            if command in ["npx", "npx.cmd"]:
-                npm_path = shutil.which("npm")
-                if npm_path:
-                    # Try to use npx from the npm directory
-                    import os
-                    npm_dir = os.path.dirname(npm_path)
-                    npx_path = os.path.join(npm_dir, "npx.cmd" if platform.system() == "Windows" else "npx")
-                    if os.path.exists(npx_path):
-                        command_path = npx_path
-            
-            if not command_path:
-                raise MCPServerError("unknown", f"Command not found: {config.command}")
+            raise MCPServerError("unknown", f"Command not found: {config.command}")
         
         # For FastMCP, we use the generic StdioTransport
         # and pass the command and args directly
@@ -213,30 +255,7 @@ class MCPServerManager:
             logger.info(f"Starting MCP server {server.server_id} with command: {config.command} {' '.join(config.args)}")
             
             # Test if the command works first
-            import subprocess
-            import shutil
-            import os
-            import platform
-            
-            # Handle Windows-specific command path issues
-            command = config.command
-            if platform.system() == "Windows" and command == "npx":
-                # On Windows, use npx.cmd instead of npx to avoid path issues
-                command = "npx.cmd"
-            
-            # Get full path to command
-            command_path = shutil.which(command)
-            if not command_path:
-                # For npx/npx.cmd, try to find npm instead and use npx from there
-                if command in ["npx", "npx.cmd"]:
-                    npm_path = shutil.which("npm")
-                    if npm_path:
-                        # Try to use npx from the npm directory
-                        npm_dir = os.path.dirname(npm_path)
-                        npx_path = os.path.join(npm_dir, "npx.cmd" if platform.system() == "Windows" else "npx")
-                        if os.path.exists(npx_path):
-                            command_path = npx_path
-            
+            command_path = _resolve_server_command(config.command)
             if not command_path:
                 raise Exception(f"Command not found: {config.command}")
             
@@ -1,11 +1,57 @@
 from typing import List, Optional, Dict, Any, Callable, Type, Union
 import os
+import asyncio
 import logging
 import glob as glob_module
+from concurrent.futures import ThreadPoolExecutor
+from tqdm import tqdm
 from spoon_ai.retrieval.chroma import Document
 
 logger = logging.getLogger(__name__)
 
+# Files loaded concurrently per batch by aload_directory
+LOAD_BATCH_SIZE = 64
+
+def expand_braces(pattern: str) -> List[str]:
+    """Expand shell-style brace alternatives, which the glob module doesn't support.
+
+    "**/*.{txt,md}" -> ["**/*.txt", "**/*.md"]
+    "a{b,c{d,e}}f" -> ["abf", "acdf", "acef"]
+
+    The first outermost group is split on its top-level commas, so nested
+    groups expand once each. Groups without a comma and unbalanced braces
+    are kept literally.
+    """
+    depth = 0
+    open_at = 0
+    commas: List[int] = []
+    for i, char in enumerate(pattern):
+        if char == '{':
+            if depth == 0:
+                open_at, commas = i, []
+            depth += 1
+        elif char == ',' and depth == 1:
+            commas.append(i)
+        elif char == '}' and depth:
+            depth -= 1
+            if depth:
+                continue
+            head, tail = pattern[:open_at], pattern[i + 1:]
+            if not commas:
+                # Literal {...}; its content and the tail may still hold groups
+                return [
+                    head + '{' + inner + '}' + rest
+                    for inner in expand_braces(pattern[open_at + 1:i])
+                    for rest in expand_braces(tail)
+                ]
+            bounds = [open_at] + commas + [i]
+            return [
+                expanded
+                for left, right in zip(bounds, bounds[1:])
+                for expanded in expand_braces(head + pattern[left + 1:right] + tail)
+            ]
+    return [pattern]
+
 class BasicTextSplitter:
     """Simple text splitter to replace langchain's RecursiveCharacterTextSplitter"""
     
@@ -24,27 +70,36 @@ class BasicTextSplitter:
         while start < len(text):
             end = min(start + self.chunk_size, len(text))
             
-            # If not the last chunk, try to split at whitespace
+            if end >= len(text):
+                # Last chunk; stepping back by the overlap would repeat it forever
+                chunks.append(text[start:end])
+                break
+
+            # If not the last chunk, try to split at whitespace. Break points
+            # within chunk_overlap of start are ignored: the next chunk starts
+            # chunk_overlap before the break, so it would not move forward.
             if end < len(text):
+                search_from = start + self.chunk_overlap
                 # Try to split at paragraph ends
-                paragraph_end = text.rfind('\n\n', start, end)
+                paragraph_end = text.rfind('\n\n', search_from, end)
                 if paragraph_end > start:
                     end = paragraph_end + 2  # Include two newlines
                 else:
                     # Try to split at sentence ends
                     sentence_end = max(
-                        text.rfind('. ', start, end),
-                        text.rfind('? ', start, end),
-                        text.rfind('! ', start, end),
-                        text.rfind('.\n', start, end),
-                        text.rfind('?\n', start, end),
-                        text.rfind('!\n', start, end)
+                        text.rfind('. ', search_from, end),
+                        text.rfind('? ', search_from, end),
+                        text.rfind('! ', search_from, end),
+                        text.rfind('.\n', search_from, end),
+                        text.rfind('?\n', search_from, end),
+                        text.rfind('!\n', search_from, end)
                     )
                     if sentence_end > start:
                         end = sentence_end + 2  # Include separator and space
             
             chunks.append(text[start:end])
-            start = end - self.chunk_overlap
+            # Always advance, even when chunk_overlap >= chunk_size
+            start = max(end - self.chunk_overlap, start + 1)
             
         return chunks
         
@@ -102,46 +157,99 @@ class DocumentLoader:
             logger.error(f"Error loading file {file_path}: {e}")
             return []
     
+    def _collect_files(self, directory_path: str, glob_pattern: Optional[str] = None) -> List[str]:
+        """List the files load_directory would load, in load order"""
+        if not os.path.exists(directory_path):
+            raise FileNotFoundError(f"Directory not found: {directory_path}")
+
+        # Use glob to match files; braces are expanded once up front and a file
+        # matched by several alternatives is only loaded once
+        if glob_pattern:
+            file_paths = []
+            seen = set()
+            for pattern in expand_braces(glob_pattern):
+                for file_path in glob_module.iglob(os.path.join(directory_path, pattern), recursive=True):
+                    if file_path in seen or not os.path.isfile(file_path):
+                        continue
+                    seen.add(file_path)
+                    # A broad pattern can match types load_file would reject
+                    # (e.g. .md); skip them rather than failing the whole load
+                    if os.path.splitext(file_path)[1].lower() not in self.extension_loaders:
+                        logger.info("Skipping unsupported file: %s", file_path)
+                        continue
+                    file_paths.append(file_path)
+            return file_paths
+
+        # Traverse directory to find all supported files
+        file_paths = []
+        for root, _, files in os.walk(directory_path):
+            for file in files:
+                _, ext = os.path.splitext(file)
+                if ext.lower() in self.extension_loaders:
+                    file_paths.append(os.path.join(root, file))
+        return file_paths
+
+    def _load_file_quietly(self, file_path: str) -> List[Document]:
+        """Load a file found by directory traversal, logging instead of raising on failure"""
+        try:
+            docs = self.load_file(file_path)
+            logger.info("Loaded document: %s", file_path)
+            return docs
+        except Exception as e:
+            logger.error("Error loading %s: %s", file_path, e)
+            return []
+
+    def _file_loader(self, glob_pattern: Optional[str]) -> Callable[[str], List[Document]]:
+        # Files the user matched explicitly surface their errors; files picked
+        # up by traversal are skipped on error
+        return self.load_file if glob_pattern else self._load_file_quietly
+
     def load_directory(self, directory_path: str, glob_pattern: Optional[str] = None) -> List[Document]:
         """Load documents from a directory"""
         # Check if the path is a file instead of a directory
         if os.path.isfile(directory_path):
             return self.load_file(directory_path)
-            
-        if not os.path.exists(directory_path):
-            raise FileNotFoundError(f"Directory not found: {directory_path}")
-        
+
+        file_paths = self._collect_files(directory_path, glob_pattern)
+        load = self._file_loader(glob_pattern)
+
+        # load_file already splits each document, so the chunks are final here
         documents = []
-        
-        # Use glob to match files
-        if glob_pattern:
-            file_paths = glob_module.glob(os.path.join(directory_path, glob_pattern), recursive=True)
-            for file_path in file_paths:
-                if os.path.isfile(file_path):
-                    docs = self.load_file(file_path)
+        with ThreadPoolExecutor() as pool:
+            for docs in pool.map(load, file_paths):
+                documents.extend(docs)
+
+        logger.info("Loaded %d chunks from %d files", len(documents), len(file_paths))
+        return documents
+
+    async def aload_directory(
+        self,
+        directory_path: str,
+        glob_pattern: Optional[str] = None,
+        show_progress: bool = False
+    ) -> List[Document]:
+        """Load documents from a directory without blocking the event loop
+
+        Files are read concurrently in worker threads, LOAD_BATCH_SIZE at a time
+        so a large directory doesn't hold every file in flight at once.
+        """
+        if os.path.isfile(directory_path):
+            return await asyncio.to_thread(self.load_file, directory_path)
+
+        file_paths = await asyncio.to_thread(self._collect_files, directory_path, glob_pattern)
+        load = self._file_loader(glob_pattern)
+
+        documents = []
+        with tqdm(total=len(file_paths), unit="file", desc="Loading documents", disable=not show_progress) as progress:
+            for i in range(0, len(file_paths), LOAD_BATCH_SIZE):
+                batch = file_paths[i:i + LOAD_BATCH_SIZE]
+                for docs in await asyncio.gather(*(asyncio.to_thread(load, path) for path in batch)):
                     documents.extend(docs)
-        else:
-            # Traverse directory to load all supported files
-            for root, _, files in os.walk(directory_path):
-                for file in files:
-                    file_path = os.path.join(root, file)
-                    _, ext = os.path.splitext(file_path)
-                    ext = ext.lower()
-                    
-                    if ext in self.extension_loaders:
-                        try:
-                            docs = self.load_file(file_path)
-                            documents.extend(docs)
-                            logger.info(f"Loaded document: {file_path}")
-                        except Exception as e:
-                            logger.error(f"Error loading {file_path}: {e}")
-        
-        # Split documents
-        split_docs = self.text_splitter.split_documents(documents)
-        logger.info(f"Split into {len(split_docs)} chunks")
-        
-        return split_docs
-    
+                progress.update(len(batch))
+
+        logger.info("Loaded %d chunks from %d files", len(documents), len(file_paths))
+        return documents
+
     def load_file(self, file_path: str) -> List[Document]:
         """Load a single file and return the documents"""
         if not os.path.exists(file_path):
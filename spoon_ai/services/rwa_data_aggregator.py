@@ -5,7 +5,7 @@ RWA Data Aggregator Service - 聚合和缓存RWA协议数据
 import asyncio
 import json
 import os
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterable, Optional
 from datetime import datetime, timedelta
 from dataclasses import dataclass, asdict
 import aiohttp
@@ -239,11 +239,20 @@ class RWADataAggregator:
     
     async def fetch_all_yields(self, use_cache: bool = True) -> Dict[str, ProtocolYieldData]:
         """获取所有协议的收益数据"""
+        return await self.fetch_yields(self.protocols.keys(), use_cache=use_cache)
+    
+    async def fetch_yields(self, protocol_names: Iterable[str], use_cache: bool = True) -> Dict[str, ProtocolYieldData]:
+        """获取指定协议的收益数据（不支持的协议将被忽略）"""
         results = {}
+        connectors = {
+            name: self.protocols[name]
+            for name in dict.fromkeys(protocol_names)
+            if name in self.protocols
+        }
         
-        # 并行获取所有协议数据
+        # 并行获取协议数据
         tasks = []
-        for protocol_name, connector in self.protocols.items():
+        for protocol_name, connector in connectors.items():
             if use_cache:
                 task = self._fetch_with_cache(protocol_name, connector)
             else:
@@ -253,7 +262,7 @@ class RWADataAggregator:
         protocol_data_list = await asyncio.gather(*tasks, return_exceptions=True)
         
         # 处理结果
-        for protocol_name, data in zip(self.protocols.keys(), protocol_data_list):
+        for protocol_name, data in zip(connectors.keys(), protocol_data_list):
             if isinstance(data, Exception):
                 logger.error(f"Failed to fetch {protocol_name} data: {data}")
                 # 尝试使用缓存数据
@@ -332,9 +341,16 @@ class RWADataAggregator:
         apy = (1 + rate / n) ** n - 1
         return apy * 100  # 转换为百分比
     
-    async def get_aggregated_stats(self) -> Dict[str, Any]:
-        """获取聚合统计数据"""
-        all_data = await self.fetch_all_yields()
+    async def get_aggregated_stats(
+        self,
+        all_data: Optional[Dict[str, ProtocolYieldData]] = None
+    ) -> Dict[str, Any]:
+        """获取聚合统计数据
+
+        all_data: 已获取的协议数据（如API层缓存），为空时重新获取
+        """
+        if all_data is None:
+            all_data = await self.fetch_all_yields()
         
         total_tvl = sum(data.tvl for data in all_data.values())
         avg_apy = sum(data.apy for data in all_data.values()) / len(all_data) if all_data else 0
@@ -1,7 +1,7 @@
 import logging
 import os
 import time
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 import requests
 from web3 import Web3, HTTPProvider
@@ -12,8 +12,18 @@ from .abi import ERC20_ABI
 logger = logging.getLogger(__name__)
 
 class Aggregator:
+    # Seconds a token info lookup (which includes the live USD price) is reused
+    TOKEN_INFO_TTL = 30
+    # Upper bound on entries in each token lookup cache
+    TOKEN_CACHE_SIZE = 1024
+
     def __init__(self, network: str = "ethereum", rpc_url: str = None, scan_url: str = None, chain_id: int = 1):
         self.network = network
+        # Token decimals never change for a contract, so they are cached without expiry
+        self._decimals_cache: Dict[str, int] = {}
+        self._token_info_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        # (symbol, network) -> contract address found by the CoinGecko reverse search
+        self._symbol_address_cache: Dict[Tuple[str, str], str] = {}
         self.rpc_url = rpc_url
         if not self.rpc_url:
             raise ValueError("rpc_url is required")
@@ -44,10 +54,41 @@ class Aggregator:
     def get_native_token_address(self)->str:
         return "0xEeeeeEeeeEeEeeEeEeEeeEEEeeeeEeeeeeeeEEeE"
 
+    @classmethod
+    def _cache_put(cls, cache: Dict, key, value) -> None:
+        """Store value in cache, evicting the oldest entry once the cache is full"""
+        if key not in cache and len(cache) >= cls.TOKEN_CACHE_SIZE:
+            del cache[next(iter(cache))]
+        cache[key] = value
+
+    def _get_decimals(self, token_address: str) -> int:
+        """Read decimals() from the token contract once per address"""
+        key = token_address.lower()
+        decimals = self._decimals_cache.get(key)
+        if decimals is None:
+            token_address_checksum = Web3.to_checksum_address(token_address)
+            contract = self._web3.eth.contract(address=token_address_checksum, abi=ERC20_ABI)
+            decimals = contract.functions.decimals().call()
+            self._cache_put(self._decimals_cache, key, decimals)
+        return decimals
+
     def get_token_info_by_address(self, token_address: str) -> Dict[str, Any]:
         """
-        Get token information from contract address using CoinGecko API
+        Get token information from contract address using CoinGecko API.
+        Results are reused for TOKEN_INFO_TTL seconds.
         """
+        key = token_address.lower()
+        cached = self._token_info_cache.get(key)
+        if cached and time.monotonic() - cached[0] < self.TOKEN_INFO_TTL:
+            return dict(cached[1])
+
+        token_info = self._fetch_token_info_by_address(token_address)
+        if token_info:
+            self._cache_put(self._token_info_cache, key, (time.monotonic(), token_info))
+            return dict(token_info)
+        return token_info
+
+    def _fetch_token_info_by_address(self, token_address: str) -> Dict[str, Any]:
         try:
             if token_address.lower() == self.get_native_token_address().lower():
                 # Handle native token
@@ -109,9 +150,7 @@ class Aggregator:
             # Get token decimals from contract if not provided by CoinGecko
             decimals = 18  # Default
             try:
-                token_address_checksum = Web3.to_checksum_address(token_address)
-                contract = self._web3.eth.contract(address=token_address_checksum, abi=ERC20_ABI)
-                decimals = contract.functions.decimals().call()
+                decimals = self._get_decimals(token_address)
             except Exception as e:
                 logger.warning(f"Could not get decimals from contract: {e}")
             
@@ -147,6 +186,11 @@ class Aggregator:
             
             if symbol.upper() == native_symbols.get(self.network, ""):
                 return self.get_token_info_by_address(self.get_native_token_address())
+
+            symbol_key = (symbol.lower(), self.network)
+            token_address = self._symbol_address_cache.get(symbol_key)
+            if token_address:
+                return self.get_token_info_by_address(token_address)
             
             if not hasattr(self, "coins"):
                 # Search for the token in CoinGecko
@@ -187,6 +231,7 @@ class Aggregator:
                 
                 if platform in platforms and platforms[platform]:
                     token_address = platforms[platform]
+                    self._cache_put(self._symbol_address_cache, symbol_key, token_address)
                     return self.get_token_info_by_address(token_address)
             
             # If we couldn't find a token with matching symbol on the current network
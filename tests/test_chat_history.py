@@ -0,0 +1,60 @@
+"""
+Tests for saving and reloading CLI chat histories
+"""
+
+import json
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+from cli.commands import DEFAULT_HISTORY_WINDOW, SpoonAICLI
+from spoon_ai.agents.base import BaseAgent
+
+
+def _make_agent(name: str):
+    agent = SimpleNamespace(name=name)
+    # save_chat_history only needs name and chat_history
+    agent.save_chat_history = lambda: BaseAgent.save_chat_history(agent)
+    return agent
+
+
+def _make_cli(agent):
+    # Skip __init__: only the current agent and the config lookup are needed
+    cli = SpoonAICLI.__new__(SpoonAICLI)
+    cli.current_agent = agent
+    cli.config_manager = Mock()
+    cli.config_manager.get.side_effect = lambda key, default=None: default
+    return cli
+
+
+def _saved_messages(tmp_path, name: str):
+    history = json.loads((tmp_path / "chat_logs" / f"{name}_history.json").read_text(encoding="utf-8"))
+    return history["messages"]
+
+
+async def test_long_history_survives_reload_and_save(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    count = DEFAULT_HISTORY_WINDOW + 50
+    messages = [
+        {"role": "user" if i % 2 == 0 else "assistant", "content": f"message {i}"}
+        for i in range(count)
+    ]
+
+    agent = _make_agent("rwa")
+    agent.chat_history = {
+        "metadata": {"agent_name": "rwa", "created_at": "2026-01-01 00:00:00", "updated_at": "2026-01-01 00:00:00"},
+        "messages": messages,
+    }
+    agent.save_chat_history()
+
+    # Reload into a fresh agent, continue the chat and save again
+    reloaded = _make_agent("rwa")
+    reloaded.chat_history = []
+    cli = _make_cli(reloaded)
+    await cli._handle_load_chat(["rwa"])
+    chat_messages = cli._get_chat_messages(reloaded)
+    chat_messages.append({"role": "user", "content": "one more"})
+    reloaded.save_chat_history()
+
+    saved = _saved_messages(tmp_path, "rwa")
+    assert saved == messages + [{"role": "user", "content": "one more"}]
+    assert len(cli._recent_messages(chat_messages)) == DEFAULT_HISTORY_WINDOW
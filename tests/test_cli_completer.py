@@ -0,0 +1,39 @@
+"""
+Tests for the CLI command name completer
+"""
+
+from prompt_toolkit.completion import CompleteEvent
+from prompt_toolkit.document import Document
+
+from cli.completer import PrefixCompleter
+
+
+COMMANDS = ["help", "load-agent", "list-agents", "load-docs", "delete-docs", "Exit", "LLM-status"]
+
+
+def _complete(text: str):
+    completer = PrefixCompleter(COMMANDS)
+    completions = list(completer.get_completions(Document(text), CompleteEvent()))
+    return [(completion.text, completion.start_position) for completion in completions]
+
+
+def test_case_insensitive_match():
+    assert _complete("EX") == [("Exit", -2)]
+    assert _complete("llm") == [("LLM-status", -3)]
+
+
+def test_hyphenated_names():
+    assert _complete("load-") == [("load-agent", -5), ("load-docs", -5)]
+    assert _complete("load-d") == [("load-docs", -6)]
+    assert _complete("l") == [("list-agents", -1), ("LLM-status", -1), ("load-agent", -1), ("load-docs", -1)]
+
+
+def test_empty_prefix_lists_every_command():
+    completions = _complete("")
+    assert sorted(text for text, _ in completions) == sorted(COMMANDS)
+    assert all(start == 0 for _, start in completions)
+
+
+def test_no_match():
+    assert _complete("zzz") == []
+    assert _complete("load-agent-x") == []
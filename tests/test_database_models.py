@@ -0,0 +1,112 @@
+"""
+Tests for the SQLite database models
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from database.models import DatabaseManager
+
+
+@pytest.fixture
+def db(tmp_path):
+    manager = DatabaseManager(str(tmp_path / "data" / "rwa_optimizer.db"))
+    yield manager
+    manager.close()
+
+
+def _days_ago(days: float) -> str:
+    return (datetime.now(timezone.utc) - timedelta(days=days)).isoformat()
+
+
+def _insert_protocol_row(conn, protocol: str, timestamp: str, apy: float = 8.0):
+    conn.execute(
+        "INSERT INTO protocol_data (protocol, current_apy, risk_score, asset_type, tvl, timestamp) "
+        "VALUES (?, ?, 0.3, 'private_credit', 1000000.0, ?)",
+        (protocol, apy, timestamp)
+    )
+
+
+def test_naive_timestamps_migrated_to_utc(db):
+    naive = "2024-01-15T10:30:00.123456"
+    conn = db.get_connection()
+    with conn:
+        conn.execute("PRAGMA user_version = 0")
+        _insert_protocol_row(conn, "centrifuge", naive)
+        _insert_protocol_row(conn, "maple", "2024-01-15T10:30:00+00:00")
+        conn.execute(
+            "INSERT INTO user_settings (setting_key, setting_value, timestamp) VALUES ('theme', 'dark', ?)",
+            (naive,)
+        )
+
+    db.init_database()
+
+    expected = datetime.fromisoformat(naive).astimezone(timezone.utc).isoformat()
+    rows = dict(conn.execute("SELECT protocol, timestamp FROM protocol_data").fetchall())
+    assert rows == {"centrifuge": expected, "maple": "2024-01-15T10:30:00+00:00"}
+    assert conn.execute("SELECT timestamp FROM user_settings").fetchone()[0] == expected
+    assert conn.execute("PRAGMA user_version").fetchone()[0] >= 1
+
+
+def test_timestamp_migration_runs_once(db):
+    conn = db.get_connection()
+    with conn:
+        _insert_protocol_row(conn, "centrifuge", "2024-01-15T10:30:00")
+
+    db.init_database()
+
+    assert conn.execute("SELECT timestamp FROM protocol_data").fetchone()[0] == "2024-01-15T10:30:00"
+
+
+def test_get_all_latest_protocols(db):
+    conn = db.get_connection()
+    with conn:
+        for days, apy in ((20, 7.0), (2, 9.5), (10, 8.0)):
+            _insert_protocol_row(conn, "centrifuge", _days_ago(days), apy)
+        for days, apy in ((1, 8.7), (5, 8.1)):
+            _insert_protocol_row(conn, "maple", _days_ago(days), apy)
+        _insert_protocol_row(conn, "goldfinch", _days_ago(40), 12.3)
+
+    latest = {row.protocol: row.current_apy for row in db.get_all_latest_protocols()}
+
+    assert latest == {"centrifuge": 9.5, "maple": 8.7, "goldfinch": 12.3}
+
+
+def test_get_protocol_history_window(db):
+    conn = db.get_connection()
+    with conn:
+        for days, apy in ((45, 6.0), (25, 7.0), (12, 8.0), (1, 9.0)):
+            _insert_protocol_row(conn, "centrifuge", _days_ago(days), apy)
+        _insert_protocol_row(conn, "maple", _days_ago(3), 8.7)
+
+    history = db.get_protocol_history("centrifuge", days=30)
+
+    assert [row.current_apy for row in history] == [7.0, 8.0, 9.0]
+    assert [row.current_apy for row in db.get_protocol_history("centrifuge", days=7)] == [9.0]
+    assert db.get_protocol_history("truefi", days=30) == []
+
+
+def test_cleanup_old_data(db):
+    conn = db.get_connection()
+    with conn:
+        for days in (120, 95, 30):
+            timestamp = _days_ago(days)
+            _insert_protocol_row(conn, "centrifuge", timestamp)
+            conn.execute(
+                "INSERT INTO ai_predictions (protocol, timeframe, predicted_apy, confidence, model_name, timestamp) "
+                "VALUES ('centrifuge', '90d', 9.0, 0.8, 'test', ?)",
+                (timestamp,)
+            )
+            conn.execute(
+                "INSERT INTO portfolio_allocations (session_id, protocol, allocation_amount, "
+                "allocation_percentage, expected_apy, risk_score, timestamp) "
+                "VALUES ('session', 'centrifuge', 1000.0, 50.0, 9.0, 0.3, ?)",
+                (timestamp,)
+            )
+
+    db.cleanup_old_data(days=90)
+
+    for table in ("protocol_data", "ai_predictions", "portfolio_allocations"):
+        assert conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0] == 1
+    assert [row.current_apy for row in db.get_protocol_history("centrifuge", days=90)] == [8.0]
@@ -0,0 +1,141 @@
+"""
+Tests for document loading and text splitting
+"""
+
+import asyncio
+import threading
+
+from spoon_ai.retrieval.document_loader import BasicTextSplitter, DocumentLoader, expand_braces
+
+
+def _run(func, *args, timeout: float = 5.0):
+    """Run func in a worker thread so a regression fails instead of hanging."""
+    result = []
+    worker = threading.Thread(target=lambda: result.extend(func(*args)), daemon=True)
+    worker.start()
+    worker.join(timeout)
+    assert not worker.is_alive(), f"{func.__name__} did not terminate"
+    return result
+
+
+def _split(splitter: BasicTextSplitter, text: str):
+    return _run(splitter.split_text, text)
+
+
+def _multi_paragraph_text() -> str:
+    paragraphs = [
+        "Tokenized treasuries are the largest segment of on-chain real world assets.",
+        "Ondo Finance offers OUSG and USDY. Both track short-dated US government debt! "
+        "Yields follow the federal funds rate minus a management fee.",
+        "Centrifuge finances invoices, real estate bridge loans and trade receivables? "
+        "Pools are split into senior and junior tranches.\n"
+        "Maple Finance lends to institutional borrowers against collateral.",
+    ]
+    return "\n\n".join(paragraphs * 30)
+
+
+def test_split_text_break_near_start():
+    """A paragraph break right after start must not move the window backwards."""
+    text = "Intro line.\n\n" + "x" * 1500
+    chunks = _split(BasicTextSplitter(), text)
+
+    assert chunks[0].startswith("Intro line.")
+    assert chunks[-1].endswith("x")
+    assert all(len(chunk) <= 1000 for chunk in chunks)
+
+
+def test_split_text_multi_paragraph():
+    text = _multi_paragraph_text()
+    splitter = BasicTextSplitter(chunk_size=400, chunk_overlap=100)
+    chunks = _split(splitter, text)
+
+    # Chunks may end early at a break, but the window keeps moving forward
+    assert len(chunks) < len(text) // 100
+    assert all(0 < len(chunk) <= 400 for chunk in chunks)
+    assert chunks[0] == text[:len(chunks[0])]
+    assert text.endswith(chunks[-1])
+    # Every chunk is a slice of the source, in order, with no gaps
+    position = 0
+    for chunk in chunks:
+        found = text.find(chunk, max(position - 400, 0))
+        assert 0 <= found <= position
+        position = found + len(chunk)
+    assert position == len(text)
+
+
+def test_split_text_overlap_not_smaller_than_chunk_size():
+    chunks = _split(BasicTextSplitter(chunk_size=100, chunk_overlap=100), "y" * 250)
+
+    assert chunks[-1].endswith("y")
+    assert all(len(chunk) <= 100 for chunk in chunks)
+
+
+def test_split_text_short_text():
+    assert BasicTextSplitter().split_text("short") == ["short"]
+    assert BasicTextSplitter().split_text("") == []
+
+
+def test_expand_braces_flat():
+    assert expand_braces("**/*.{txt,md}") == ["**/*.txt", "**/*.md"]
+    assert expand_braces("{a,b}/{c,d}") == ["a/c", "a/d", "b/c", "b/d"]
+    assert expand_braces("**/*.txt") == ["**/*.txt"]
+
+
+def test_expand_braces_nested():
+    assert expand_braces("a{b,c{d,e}}f") == ["abf", "acdf", "acef"]
+    assert expand_braces("{x{a,b}}") == ["{xa}", "{xb}"]
+
+
+def test_expand_braces_empty_and_unbalanced():
+    assert expand_braces("") == [""]
+    assert expand_braces("a{}b") == ["a{}b"]
+    assert expand_braces("a{,b}c") == ["ac", "abc"]
+    assert expand_braces("a{b,c") == ["a{b,c"]
+    assert expand_braces("a}b{c,d}") == ["a}bc", "a}bd"]
+
+
+def _write_docs(directory):
+    (directory / "notes").mkdir()
+    (directory / "overview.txt").write_text("Intro line.\n\n" + "x" * 1500, encoding="utf-8")
+    (directory / "notes" / "protocols.txt").write_text(_multi_paragraph_text(), encoding="utf-8")
+    (directory / "notes" / "rates.json").write_text('{"ondo": 5.2, "maple": 7.1}', encoding="utf-8")
+    (directory / "image.png").write_bytes(b"\x89PNG")
+
+
+def _sources(documents):
+    return sorted({doc.metadata["filename"] for doc in documents})
+
+
+def test_load_directory(tmp_path):
+    _write_docs(tmp_path)
+    documents = _run(DocumentLoader().load_directory, str(tmp_path))
+
+    assert _sources(documents) == ["overview.txt", "protocols.txt", "rates.json"]
+    overview = [doc for doc in documents if doc.metadata["filename"] == "overview.txt"]
+    assert [doc.metadata["chunk"] for doc in overview] == list(range(len(overview)))
+    assert all(len(doc.page_content) <= 1000 for doc in documents)
+
+
+def test_load_directory_glob(tmp_path):
+    _write_docs(tmp_path)
+    documents = _run(DocumentLoader().load_directory, str(tmp_path), "**/*.{txt,json}")
+
+    assert _sources(documents) == ["overview.txt", "protocols.txt", "rates.json"]
+
+
+def test_load_directory_mixed_extension_glob(tmp_path):
+    _write_docs(tmp_path)
+    (tmp_path / "notes" / "readme.md").write_text("# Notes", encoding="utf-8")
+    documents = _run(DocumentLoader().load_directory, str(tmp_path), "**/*.{txt,pdf,md,png}")
+
+    # Matched files without a loader are skipped instead of failing the load
+    assert _sources(documents) == ["overview.txt", "protocols.txt"]
+
+
+async def test_aload_directory(tmp_path):
+    _write_docs(tmp_path)
+    loader = DocumentLoader()
+    documents = await asyncio.wait_for(loader.aload_directory(str(tmp_path)), timeout=5)
+
+    expected = _run(loader.load_directory, str(tmp_path))
+    assert sorted(doc.page_content for doc in documents) == sorted(doc.page_content for doc in expected)
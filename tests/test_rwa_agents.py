@@ -17,12 +17,14 @@ from spoon_ai.tools import (
 )
 from spoon_ai.chat import ChatBot
 from spoon_ai.services import ProtocolYieldData
+from spoon_ai.schema import AgentState
 from api import (
     YieldAnalysisRequest,
     PortfolioOptimizationRequest,
     CompareYieldsRequest,
     YieldForecastRequest
 )
+from api.rwa_api import _borrow_agent, _reset_yield_agent
 from typing import Dict, Any, List
 
 
@@ -165,6 +167,37 @@ async def test_rwa_yield_agent_optimize_portfolio_logic(mock_rwa_yield_agent: RW
         # Since we're mocking, we don't need to check the prompt content
 
 
+@pytest.mark.asyncio
+async def test_pooled_yield_agent_reset_between_borrows(mock_rwa_yield_agent: RWAYieldAgent):
+    """测试Agent池归还后再次借出的实例不保留上一次请求的状态"""
+    pool = asyncio.Queue(maxsize=1)
+    created = []
+
+    async def factory():
+        created.append(mock_rwa_yield_agent)
+        return mock_rwa_yield_agent
+
+    async with _borrow_agent(pool, factory, _reset_yield_agent) as agent:
+        default_prompt = agent.next_step_prompt
+        # 模拟一次请求对Agent的改写
+        agent.add_message("user", "请分析centrifuge")
+        agent.state = AgentState.FINISHED
+        agent.current_step = 3
+        agent.handle_struck_state()
+        agent.output_queue.put_nowait("token")
+        agent.task_done.set()
+
+    async with _borrow_agent(pool, factory, _reset_yield_agent) as again:
+        assert again is agent
+        assert len(created) == 1
+        assert again.memory.get_messages() == []
+        assert again.state == AgentState.IDLE
+        assert again.current_step == 0
+        assert again.next_step_prompt == default_prompt
+        assert again.output_queue.empty()
+        assert not again.task_done.is_set()
+
+
 # Helper functions for mocking
 def mock_protocol_data(protocol: str, asset_type: str = "mixed") -> ProtocolYieldData:
     """生成模拟的协议数据"""
@@ -11,10 +11,15 @@ This test demonstrates and validates:
 """
 
 import asyncio
+import contextlib
+import io
 import json
+import sys
 import tempfile
 import os
 from pathlib import Path
+from types import ModuleType
+from unittest.mock import Mock, patch
 
 
 def get_tavily_api_key():
@@ -630,6 +635,98 @@ def test_error_handling():
         return False
 
 
+def test_delete_docs_command():
+    """Test delete-docs argument handling without loading real agents."""
+    print("\n" + "=" * 70)
+    print("DELETE-DOCS COMMAND TEST")
+    print("=" * 70)
+    
+    from cli.commands import SpoonAICLI
+    
+    # Skip __init__: only the agent registry is needed by the handler
+    cli = SpoonAICLI.__new__(SpoonAICLI)
+    current_agent, other_agent = Mock(), Mock()
+    cli.current_agent = current_agent
+    cli.agents = {"react": current_agent, "rwa": other_agent}
+    
+    def run(args):
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            cli._handle_delete_docs(args)
+        return output.getvalue()
+    
+    # 1. No arguments: the current agent's documents are deleted
+    print("1. Testing delete-docs with no arguments...")
+    assert run([]) == ""
+    current_agent.delete_documents.assert_called_once_with()
+    other_agent.delete_documents.assert_not_called()
+    print("[OK] Current agent documents deleted")
+    
+    # 2. One agent name: only that agent's documents are deleted
+    print("\n2. Testing delete-docs with an agent name...")
+    current_agent.reset_mock()
+    assert run(["rwa"]) == ""
+    other_agent.delete_documents.assert_called_once_with()
+    current_agent.delete_documents.assert_not_called()
+    print("[OK] Named agent documents deleted")
+    
+    # 3. Unknown agent: reported, nothing deleted
+    print("\n3. Testing delete-docs with an unknown agent...")
+    other_agent.reset_mock()
+    assert "Agent missing not found" in run(["missing"])
+    current_agent.delete_documents.assert_not_called()
+    other_agent.delete_documents.assert_not_called()
+    print("[OK] Unknown agent reported")
+    
+    # 4. Too many arguments: usage is printed, nothing deleted
+    print("\n4. Testing delete-docs with too many arguments...")
+    assert "Usage: delete-docs" in run(["react", "rwa"])
+    current_agent.delete_documents.assert_not_called()
+    other_agent.delete_documents.assert_not_called()
+    print("[OK] Usage shown for extra arguments")
+    
+    print("\n[OK] Delete-docs command tests passed!")
+    return True
+
+
+def test_migrate_config_rejects_bad_arguments():
+    """Test that migrate-config rejects abbreviated and unknown options."""
+    print("\n" + "=" * 70)
+    print("MIGRATE-CONFIG ARGUMENT TEST")
+    print("=" * 70)
+    
+    from cli import commands
+    
+    # Stand-in migration module so nothing is migrated if parsing lets an argument through
+    migrate_module = ModuleType("spoon_ai.config.migrate_config")
+    migrate_module.migrate_config = Mock(return_value=True)
+    migrate_module.interactive_migration = Mock(return_value=True)
+    
+    cli = commands.SpoonAICLI.__new__(commands.SpoonAICLI)
+    cli._show_migrate_help = Mock()
+    
+    cases = [
+        (["--dry"], "Unknown migrate-config argument: --dry"),
+        (["--bogus", "-d"], "Unknown migrate-config argument: --bogus"),
+        (["-f"], "Missing file path after -f/--file"),
+    ]
+    with patch.dict(sys.modules, {"spoon_ai.config.migrate_config": migrate_module}):
+        for i, (args, expected) in enumerate(cases, 1):
+            print(f"{i}. Testing migrate-config {' '.join(args)}...")
+            cli._show_migrate_help.reset_mock()
+            with patch.object(commands.logger, "error") as log_error:
+                cli._handle_migrate_config(args)
+            log_error.assert_called_once_with(expected)
+            cli._show_migrate_help.assert_called_once_with()
+            print(f"[OK] Rejected: {expected}")
+    
+    migrate_module.migrate_config.assert_not_called()
+    migrate_module.interactive_migration.assert_not_called()
+    
+    print("\n[OK] Migrate-config argument tests passed!")
+    return True
+
+
 def main():
     """Run all tests."""
     print("SPOON AI UNIFIED CONFIGURATION INTEGRATION TESTS")
@@ -662,6 +759,18 @@ def main():
     if not result:
         success = False
     
+    # Test 5: delete-docs command
+    result = test_delete_docs_command()
+    test_results.append(("Delete-Docs Command", result))
+    if not result:
+        success = False
+    
+    # Test 6: migrate-config argument validation
+    result = test_migrate_config_rejects_bad_arguments()
+    test_results.append(("Migrate-Config Arguments", result))
+    if not result:
+        success = False
+    
     # Print test summary
     print("\n" + "=" * 70)
     print("TEST RESULTS SUMMARY")